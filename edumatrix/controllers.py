@@ -2,11 +2,23 @@
 """
 This module contains the controllers for the application.
 """
-from typing import List
+import re
+from typing import Dict, Iterable, Iterator, List, Optional, Sequence, Tuple, Union
 
 from edumatrix.database import DatabaseManager
 from edumatrix.models import Course, Professor, Student
 
+# Plain non-negative integers, checked before int() so a typo does not go
+# through exception handling.
+_INT_RE = re.compile(r"^\d+$")
+
+
+def _changed_fields(**fields) -> Dict[str, object]:
+    """
+    Drop the fields that were left as None, i.e. not changed by the caller.
+    """
+    return {name: value for name, value in fields.items() if value is not None}
+
 
 class StudentController:
     """
@@ -24,6 +36,66 @@ class StudentController:
         """
         self.db_manager = db_manager
 
+    @staticmethod
+    def parse_student_fields(
+        first_name: str,
+        last_name: str,
+        age: Union[str, int, None],
+        degree_program: str,
+        completed_credits: Union[str, int, None],
+        gpa: Union[str, float, None],
+    ) -> Tuple[Optional[Tuple], Optional[str]]:
+        """
+        Converts and validates a student's fields.
+
+        Kept free of any GUI code so that the same checks can serve both the
+        student form and bulk imports. A numeric field given as None was left
+        unset and is passed through as None, which update_student treats as
+        unchanged.
+
+        Parameters
+        ----------
+        first_name : str
+        last_name : str
+        age : str, int or None
+        degree_program : str
+        completed_credits : str, int or None
+        gpa : str, float or None
+
+        Returns
+        -------
+        Tuple[Optional[Tuple], Optional[str]]
+            The converted (first_name, last_name, age, degree_program,
+            completed_credits, gpa) and None, or None and an error message.
+        """
+        first_name = first_name.strip()
+        last_name = last_name.strip()
+        degree_program = degree_program.strip()
+        try:
+            age = None if age is None else int(age)
+            if completed_credits is not None:
+                completed_credits = int(completed_credits)
+            gpa = None if gpa is None else float(gpa)
+        except ValueError:
+            return None, "Please enter valid numbers for age, credits, and GPA."
+
+        if (
+            not all([first_name, last_name, degree_program])
+            or (age is not None and age <= 0)
+            or (completed_credits is not None and completed_credits < 0)
+            or (gpa is not None and not 0 <= gpa <= 4.0)
+        ):
+            return None, "Please enter valid data for all fields."
+
+        return (
+            first_name,
+            last_name,
+            age,
+            degree_program,
+            completed_credits,
+            gpa,
+        ), None
+
     def add_student(
         self,
         first_name: str,
@@ -32,7 +104,7 @@ class StudentController:
         degree_program: str,
         completed_credits: int,
         gpa: float,
-    ):
+    ) -> int:
         """
         Adds a new student to the database.
 
@@ -50,8 +122,13 @@ class StudentController:
             Number of credits completed by the student.
         gpa : float
             Student's Grade Point Average.
+
+        Returns
+        -------
+        int
+            The ID of the new student.
         """
-        self.db_manager.create_student(
+        return self.db_manager.create_student(
             first_name, last_name, age, degree_program, completed_credits, gpa
         )
 
@@ -77,42 +154,55 @@ class StudentController:
     def update_student(
         self,
         student_id: int,
-        first_name: str,
-        last_name: str,
-        age: int,
-        degree_program: str,
-        completed_credits: int,
-        gpa: float,
-    ):
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        age: Optional[int] = None,
+        degree_program: Optional[str] = None,
+        completed_credits: Optional[int] = None,
+        gpa: Optional[float] = None,
+    ) -> Student:
         """
         Updates an existing student's information in the database.
 
+        Only the fields that are given are written; fields left as None keep
+        their stored value.
+
         Parameters
         ----------
         student_id : int
             The unique identifier of the student to update.
-        first_name : str
+        first_name : str, optional
             Updated first name.
-        last_name : str
+        last_name : str, optional
             Updated last name.
-        age : int
+        age : int, optional
             Updated age.
-        degree_program : str
+        degree_program : str, optional
             Updated degree program.
-        completed_credits : int
+        completed_credits : int, optional
             Updated number of completed credits.
-        gpa : float
+        gpa : float, optional
             Updated GPA.
+
+        Returns
+        -------
+        Student
+            The updated student, or None if there is no such student.
         """
-        self.db_manager.update_student(
+        student_data = self.db_manager.update_student(
             student_id,
-            first_name,
-            last_name,
-            age,
-            degree_program,
-            completed_credits,
-            gpa,
+            **_changed_fields(
+                first_name=first_name,
+                last_name=last_name,
+                age=age,
+                degree_program=degree_program,
+                completed_credits=completed_credits,
+                gpa=gpa,
+            ),
         )
+        if student_data:
+            return Student(*student_data)
+        return None
 
     def delete_student(self, student_id: int):
         """
@@ -134,8 +224,74 @@ class StudentController:
         List[Student]
             A list of all student objects.
         """
-        students_data = self.db_manager.list_all_students()
-        return [Student(*data) for data in students_data] if students_data else []
+        return list(self.iter_all_students())
+
+    def iter_all_students(self) -> Iterator[Student]:
+        """
+        Streams all students from the database.
+
+        Rows are converted as they are read, so no intermediate list of
+        database rows is built.
+
+        Yields
+        ------
+        Student
+            One student object at a time.
+        """
+        for data in self.db_manager.iter_all_students():
+            yield Student(*data)
+
+    def list_students_after(self, last_student_id: int, limit: int) -> List[Student]:
+        """
+        Retrieves the next page of students in ID order.
+
+        Parameters
+        ----------
+        last_student_id : int
+            The ID of the last student on the previous page, or 0 for the first.
+        limit : int
+            The maximum number of students to return.
+
+        Returns
+        -------
+        List[Student]
+            The students that follow last_student_id.
+        """
+        students_data = self.db_manager.list_students_after(last_student_id, limit)
+        return [Student(*data) for data in students_data]
+
+    def list_students_batched(self, batch_size: int = 1000) -> Iterator[List[Student]]:
+        """
+        Retrieves all students from the database, one batch at a time.
+
+        Only one batch is held in memory at once, which keeps exports of
+        large tables cheap.
+
+        Parameters
+        ----------
+        batch_size : int, optional
+            The number of students per batch. Defaults to 1000.
+
+        Yields
+        ------
+        List[Student]
+            The next batch of students, in ID order.
+        """
+        last_student_id = 0
+        while True:
+            students_data = self.db_manager.list_students_after(
+                last_student_id, batch_size
+            )
+            if not students_data:
+                return
+            yield [Student(*data) for data in students_data]
+            last_student_id = students_data[-1]["StudentID"]
+
+    def count_students(self) -> int:
+        """
+        Returns the number of students in the database.
+        """
+        return self.db_manager.count_students()
 
     def get_students_for_course(self, course_id: int):
         """
@@ -153,7 +309,23 @@ class StudentController:
         """
         return self.db_manager.get_students_for_course(course_id)
 
-    def enroll_student_in_course(self, student_id: int, course_id: int):
+    def get_students_for_courses(self, course_ids: Sequence[int]) -> Dict[int, list]:
+        """
+        Retrieves the students of several courses with a single batched query.
+
+        Parameters
+        ----------
+        course_ids : Sequence[int]
+            The IDs of the courses.
+
+        Returns
+        -------
+        Dict[int, list]
+            Each course ID mapped to the students enrolled in it.
+        """
+        return self.db_manager.get_students_for_courses(course_ids)
+
+    def enroll_student_in_course(self, student_id: int, course_id: int) -> bool:
         """
         Enrolls a student in a course.
 
@@ -165,9 +337,14 @@ class StudentController:
             The ID of the course.
         start_date : str
             The start date of the course.
+
+        Returns
+        -------
+        bool
+            False if the student was already enrolled in the course.
         """
         # self.db_manager.enroll_student_in_course(student_id, course_id, start_date)
-        self.db_manager.enroll_student_in_course(student_id, course_id)
+        return self.db_manager.enroll_student_in_course(student_id, course_id)
 
     def remove_student_from_course(self, student_id: int, course_id: int):
         """
@@ -182,6 +359,32 @@ class StudentController:
         """
         self.db_manager.remove_student_from_course(student_id, course_id)
 
+    def enroll_student_in_courses(self, student_id: int, course_ids: Iterable[int]):
+        """
+        Enrolls a student in several courses at once.
+
+        Parameters
+        ----------
+        student_id : int
+            The ID of the student.
+        course_ids : Iterable[int]
+            The IDs of the courses.
+        """
+        self.db_manager.enroll_student_in_courses(student_id, course_ids)
+
+    def remove_student_from_courses(self, student_id: int, course_ids: Iterable[int]):
+        """
+        Removes a student from several courses at once.
+
+        Parameters
+        ----------
+        student_id : int
+            The ID of the student.
+        course_ids : Iterable[int]
+            The IDs of the courses.
+        """
+        self.db_manager.remove_student_from_courses(student_id, course_ids)
+
 
 class ProfessorController:
     """
@@ -198,6 +401,42 @@ class ProfessorController:
             The database manager instance to handle database operations.
         """
         self.db_manager = db_manager
+        # Professor objects from the last list_all_professors call, dropped
+        # whenever this controller changes a professor.
+        self._professors: Optional[List[Professor]] = None
+
+    @staticmethod
+    def parse_professor_fields(
+        first_name: str,
+        last_name: str,
+        department: str,
+        academic_achievement: str,
+    ) -> Tuple[Optional[Tuple], Optional[str]]:
+        """
+        Validates the text of a professor's fields.
+
+        Parameters
+        ----------
+        first_name : str
+        last_name : str
+        department : str
+        academic_achievement : str
+
+        Returns
+        -------
+        Tuple[Optional[Tuple], Optional[str]]
+            The stripped (first_name, last_name, department,
+            academic_achievement) and None, or None and an error message.
+        """
+        fields = (
+            first_name.strip(),
+            last_name.strip(),
+            department.strip(),
+            academic_achievement.strip(),
+        )
+        if not all(fields):
+            return None, "Please enter valid data for all fields."
+        return fields, None
 
     def add_professor(
         self,
@@ -205,7 +444,7 @@ class ProfessorController:
         last_name: str,
         department: str,
         academic_achievement: str,
-    ):
+    ) -> int:
         """
         Adds a new professor to the database.
 
@@ -219,8 +458,14 @@ class ProfessorController:
             The department to which the professor belongs.
         academic_achievement : str
             The highest academic achievement of the professor (e.g., PhD in Mathematics).
+
+        Returns
+        -------
+        int
+            The ID of the new professor.
         """
-        self.db_manager.create_professor(
+        self._professors = None
+        return self.db_manager.create_professor(
             first_name, last_name, department, academic_achievement
         )
 
@@ -246,30 +491,48 @@ class ProfessorController:
     def update_professor(
         self,
         professor_id: int,
-        first_name: str,
-        last_name: str,
-        department: str,
-        academic_achievement: str,
-    ):
+        first_name: Optional[str] = None,
+        last_name: Optional[str] = None,
+        department: Optional[str] = None,
+        academic_achievement: Optional[str] = None,
+    ) -> Professor:
         """
         Updates an existing professor's information in the database.
 
+        Only the fields that are given are written; fields left as None keep
+        their stored value.
+
         Parameters
         ----------
         professor_id : int
             The unique identifier of the professor to update.
-        first_name : str
+        first_name : str, optional
             Updated first name.
-        last_name : str
+        last_name : str, optional
             Updated last name.
-        department : str
+        department : str, optional
             Updated department.
-        academic_achievement : str
+        academic_achievement : str, optional
             Updated academic achievement.
-        """
-        self.db_manager.update_professor(
-            professor_id, first_name, last_name, department, academic_achievement
+
+        Returns
+        -------
+        Professor
+            The updated professor, or None if there is no such professor.
+        """
+        self._professors = None
+        professor_data = self.db_manager.update_professor(
+            professor_id,
+            **_changed_fields(
+                first_name=first_name,
+                last_name=last_name,
+                department=department,
+                academic_achievement=academic_achievement,
+            ),
         )
+        if professor_data:
+            return Professor(*professor_data)
+        return None
 
     def delete_professor(self, professor_id: int):
         """
@@ -280,19 +543,44 @@ class ProfessorController:
         professor_id : int
             The unique identifier of the professor to be deleted.
         """
+        self._professors = None
         self.db_manager.delete_professor(professor_id)
 
     def list_all_professors(self) -> List[Professor]:
         """
         Retrieves all professors from the database.
 
+        The Professor objects are kept until a professor is added, updated or
+        deleted, so repeated calls do not rebuild them.
+
         Returns
         -------
         List[Professor]
             A list of all professor objects.
         """
-        professors_data = self.db_manager.list_all_professors()
-        return [Professor(*data) for data in professors_data] if professors_data else []
+        if self._professors is None:
+            self._professors = [
+                Professor(*data) for data in self.db_manager.list_all_professors()
+            ]
+        return list(self._professors)
+
+    def iter_professor_rows(self) -> Iterator[Tuple]:
+        """
+        Streams all professors as raw rows, without building Professor objects.
+
+        Yields
+        ------
+        Tuple
+            (ProfessorID, FirstName, LastName, Department, AcademicAchievement)
+            for one professor at a time.
+        """
+        return self.db_manager.iter_all_professors()
+
+    def count_professors(self) -> int:
+        """
+        Returns the number of professors in the database.
+        """
+        return self.db_manager.count_professors()
 
 
 class CourseController:
@@ -311,6 +599,51 @@ class CourseController:
         """
         self.db_manager = db_manager
 
+    @staticmethod
+    def parse_course_fields(
+        name: str,
+        start_date: str,
+        end_date: str,
+        credit_hours: Union[str, int, None],
+        professor_id: str,
+    ) -> Tuple[Optional[Tuple], Optional[str]]:
+        """
+        Converts and validates a course's fields.
+
+        Credit hours given as None were left unset and are passed through as
+        None, which update_course treats as unchanged.
+
+        Parameters
+        ----------
+        name : str
+        start_date : str
+            Start date in ISO format (YYYY-MM-DD).
+        end_date : str
+            End date in ISO format (YYYY-MM-DD).
+        credit_hours : str, int or None
+        professor_id : str
+
+        Returns
+        -------
+        Tuple[Optional[Tuple], Optional[str]]
+            The converted (name, start_date, end_date, credit_hours,
+            professor_id) and None, or None and an error message.
+        """
+        name = name.strip()
+        professor_id = professor_id.strip()
+        if not all([name, start_date, end_date, str(credit_hours), professor_id]):
+            return None, "Please enter valid data for all fields."
+
+        if credit_hours is not None:
+            credit_hours = str(credit_hours).strip()
+            if not _INT_RE.match(credit_hours):
+                return None, "Credits and Professor ID must be numbers."
+            credit_hours = int(credit_hours)
+        if not _INT_RE.match(professor_id):
+            return None, "Credits and Professor ID must be numbers."
+
+        return (name, start_date, end_date, credit_hours, int(professor_id)), None
+
     def add_course(
         self,
         start_date: str,
@@ -318,7 +651,7 @@ class CourseController:
         name: str,
         credit_hours: int,
         professor_id: int,
-    ):
+    ) -> int:
         """
         Adds a new course to the database.
 
@@ -334,8 +667,13 @@ class CourseController:
             The number of credit hours for the course.
         professor_id : int
             The identifier of the professor teaching the course.
+
+        Returns
+        -------
+        int
+            The ID of the new course.
         """
-        self.db_manager.create_course(
+        return self.db_manager.create_course(
             start_date, end_date, name, credit_hours, professor_id
         )
 
@@ -355,47 +693,83 @@ class CourseController:
         """
         course_data = self.db_manager.read_course(course_id)
         if course_data:
-            read_course = Course(
-                course_id=course_data[0],
-                name=course_data[3],
-                start_date=course_data[1],
-                end_date=course_data[2],
-                credit_hours=course_data[4],
-                professor_id=course_data[5],
-            )
-            return read_course
+            return self._course_from_row(course_data)
         return None
 
+    def _course_from_row(self, course_data) -> Course:
+        """
+        Builds a Course from a Courses row, adding the professor's name.
+
+        Parameters
+        ----------
+        course_data : sqlite3.Row
+            A row with the columns of DatabaseManager.COURSE_COLUMNS.
+
+        Returns
+        -------
+        Course
+            The course object for the row.
+        """
+        return Course(
+            course_id=course_data["CourseID"],
+            name=course_data["Name"],
+            start_date=course_data["StartDate"],
+            end_date=course_data["EndDate"],
+            credit_hours=course_data["CreditHours"],
+            professor_id=course_data["ProfessorID"],
+            professor_name=self.db_manager.get_professor_name(
+                course_data["ProfessorID"]
+            ),
+        )
+
     def update_course(
         self,
         course_id: int,
-        start_date: str,
-        end_date: str,
-        name: str,
-        credit_hours: int,
-        professor_id: int,
-    ):
+        start_date: Optional[str] = None,
+        end_date: Optional[str] = None,
+        name: Optional[str] = None,
+        credit_hours: Optional[int] = None,
+        professor_id: Optional[int] = None,
+    ) -> Course:
         """
         Updates an existing course's information in the database.
 
+        Only the fields that are given are written; fields left as None keep
+        their stored value.
+
         Parameters
         ----------
         course_id : int
             The unique identifier of the course to update.
-        start_date : str
+        start_date : str, optional
             Updated start date.
-        end_date : str
+        end_date : str, optional
             Updated end date.
-        name : str
+        name : str, optional
             Updated name.
-        credit_hours : int
+        credit_hours : int, optional
             Updated credit hours.
-        professor_id : int
+        professor_id : int, optional
             Updated professor ID.
-        """
-        self.db_manager.update_course(
-            course_id, start_date, end_date, name, credit_hours, professor_id
+
+        Returns
+        -------
+        Course
+            The updated course, or None if there is no such course.
+        """
+        course_data = self.db_manager.update_course(
+            course_id,
+            **_changed_fields(
+                start_date=start_date,
+                end_date=end_date,
+                name=name,
+                credit_hours=credit_hours,
+                professor_id=professor_id,
+            ),
         )
+        if course_data:
+            return self._course_from_row(course_data)
+        return None
 
     def delete_course(self, course_id: int):
         """
@@ -420,6 +794,43 @@ class CourseController:
         courses_data = self.db_manager.list_all_courses()
         return [Course(*data) for data in courses_data] if courses_data else []
 
+    def iter_all_courses(self) -> Iterator[Course]:
+        """
+        Streams all courses from the database.
+
+        Yields
+        ------
+        Course
+            One course object at a time.
+        """
+        for data in self.db_manager.iter_all_courses():
+            yield Course(*data)
+
+    def count_courses(self) -> int:
+        """
+        Returns the number of courses in the database.
+        """
+        return self.db_manager.count_courses()
+
+    def list_courses_after(self, last_course_id: int, limit: int) -> List[Course]:
+        """
+        Retrieves the next page of courses in ID order.
+
+        Parameters
+        ----------
+        last_course_id : int
+            The ID of the last course on the previous page, or 0 for the first.
+        limit : int
+            The maximum number of courses to return.
+
+        Returns
+        -------
+        List[Course]
+            The courses that follow last_course_id.
+        """
+        courses_data = self.db_manager.list_courses_after(last_course_id, limit)
+        return [Course(*data) for data in courses_data]
+
     def get_courses_for_student(self, student_id: int):
         """
         Retrieves courses for a given student.
@@ -436,6 +847,22 @@ class CourseController:
         """
         return self.db_manager.get_courses_for_student(student_id)
 
+    def get_courses_for_students(self, student_ids: Sequence[int]) -> Dict[int, list]:
+        """
+        Retrieves courses for several students with a single batched query.
+
+        Parameters
+        ----------
+        student_ids : Sequence[int]
+            The IDs of the students.
+
+        Returns
+        -------
+        Dict[int, list]
+            Each student ID mapped to the courses the student is enrolled in.
+        """
+        return self.db_manager.get_courses_for_students(student_ids)
+
     def get_courses_for_professor(self, professor_id: int):
         """
         Retrieves courses taught by a given professor.
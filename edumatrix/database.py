@@ -2,16 +2,170 @@
 """
 This module contains the DatabaseManager class.
 """
+import os
 import sqlite3
+import threading
+from contextlib import contextmanager
 from sqlite3 import Connection
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
+
+# The database file, unless overridden by the EDUMATRIX_DB environment variable
+DEFAULT_DB_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "edumatrix.db"
+)
+
+
+def get_db_path() -> str:
+    """
+    Return the path of the application's database file.
+
+    Returns
+    -------
+    str
+        The EDUMATRIX_DB environment variable if it is set, otherwise
+        DEFAULT_DB_PATH.
+    """
+    return os.environ.get("EDUMATRIX_DB", DEFAULT_DB_PATH)
 
 
 class DatabaseManager:
     """
     This class manages the SQLite database.
+
+    A single instance may be shared between threads: each thread gets its own
+    connection, and with WAL enabled readers do not block on a writer.
     """
 
-    def __init__(self, db_path: str):
+    # Applied once to every connection the manager opens.
+    CONNECTION_PRAGMAS = (
+        "PRAGMA journal_mode=WAL",
+        "PRAGMA synchronous=NORMAL",
+        "PRAGMA temp_store=MEMORY",
+        "PRAGMA cache_size=-20000",
+        "PRAGMA mmap_size=268435456",
+    )
+
+    # Size of the per-connection prepared statement cache. Every query the
+    # manager issues fits, so repeated calls skip SQLite's parse/plan step.
+    STATEMENT_CACHE_SIZE = 256
+
+    # Number of rows pulled from SQLite per fetch when streaming results.
+    FETCH_ARRAYSIZE = 256
+
+    # Maximum number of IDs bound into a single "IN (...)" query, kept well
+    # below SQLite's host parameter limit.
+    MAX_BATCH_IDS = 500
+
+    # UPDATE ... RETURNING needs SQLite 3.35+.
+    HAS_RETURNING = sqlite3.sqlite_version_info >= (3, 35, 0)
+
+    # Columns of a full record, in the order the models take them.
+    STUDENT_COLUMNS = (
+        "StudentID, FirstName, LastName, Age, DegreeProgram, CompletedCredits, GPA"
+    )
+    PROFESSOR_COLUMNS = (
+        "ProfessorID, FirstName, LastName, Department, AcademicAchievement"
+    )
+    COURSE_COLUMNS = "CourseID, StartDate, EndDate, Name, CreditHours, ProfessorID"
+
+    LIST_ALL_COURSES_SQL = """
+        SELECT CourseID, Name, StartDate, EndDate, CreditHours, ProfessorID
+        FROM Courses
+    """
+
+    # Keyword arguments accepted by the update_* methods, mapped to the column
+    # each one writes. Only these column names are ever put into the SQL text.
+    STUDENT_FIELDS = {
+        "first_name": "FirstName",
+        "last_name": "LastName",
+        "age": "Age",
+        "degree_program": "DegreeProgram",
+        "completed_credits": "CompletedCredits",
+        "gpa": "GPA",
+    }
+    PROFESSOR_FIELDS = {
+        "first_name": "FirstName",
+        "last_name": "LastName",
+        "department": "Department",
+        "academic_achievement": "AcademicAchievement",
+    }
+    COURSE_FIELDS = {
+        "start_date": "StartDate",
+        "end_date": "EndDate",
+        "name": "Name",
+        "credit_hours": "CreditHours",
+        "professor_id": "ProfessorID",
+    }
+
+    # Stored in PRAGMA user_version once the schema below is in place. Bump
+    # it whenever initialize_database gains a new migration step.
+    SCHEMA_VERSION = 3
+
+    # CREATE TABLE statements keyed by table name. The name is substituted
+    # for {table} so a definition can also be used to rebuild a table, and
+    # the table options from _table_options for {options}.
+    TABLE_DEFINITIONS = {
+        "Students": """
+            CREATE TABLE IF NOT EXISTS {table} (
+                StudentID INTEGER PRIMARY KEY,
+                FirstName TEXT NOT NULL,
+                LastName TEXT NOT NULL,
+                Age INTEGER,
+                DegreeProgram TEXT,
+                CompletedCredits INTEGER,
+                GPA REAL
+            ) {options};
+        """,
+        "Professors": """
+            CREATE TABLE IF NOT EXISTS {table} (
+                ProfessorID INTEGER PRIMARY KEY,
+                FirstName TEXT NOT NULL,
+                LastName TEXT NOT NULL,
+                Department TEXT,
+                AcademicAchievement TEXT
+            ) {options};
+        """,
+        "Courses": """
+            CREATE TABLE IF NOT EXISTS {table} (
+                CourseID INTEGER PRIMARY KEY,
+                StartDate TEXT,
+                EndDate TEXT,
+                Name TEXT NOT NULL,
+                CreditHours INTEGER,
+                ProfessorID INTEGER,
+                FOREIGN KEY (ProfessorID) REFERENCES Professors(ProfessorID)
+            ) {options};
+        """,
+        "Enrollments": """
+            CREATE TABLE IF NOT EXISTS {table} (
+                StudentID INTEGER NOT NULL,
+                CourseID INTEGER NOT NULL,
+                Grade TEXT,
+                PRIMARY KEY (StudentID, CourseID),
+                FOREIGN KEY (StudentID) REFERENCES Students(StudentID),
+                FOREIGN KEY (CourseID) REFERENCES Courses(CourseID)
+            ) {options};
+        """,
+    }
+
+    # Enrollments rows are looked up only by their composite key, so they are
+    # stored directly in the primary key b-tree instead of behind a rowid.
+    WITHOUT_ROWID_TABLES = ("Enrollments",)
+
+    # Secondary indexes, as CREATE INDEX statements keyed by index name. They
+    # serve the CourseID/ProfessorID lookups; StudentID is already covered by
+    # the leading column of the Enrollments primary key.
+    INDEX_DEFINITIONS = {
+        "idx_enroll_course": (
+            "CREATE INDEX IF NOT EXISTS idx_enroll_course"
+            " ON Enrollments (CourseID, StudentID)"
+        ),
+        "idx_courses_prof": (
+            "CREATE INDEX IF NOT EXISTS idx_courses_prof ON Courses (ProfessorID)"
+        ),
+    }
+
+    def __init__(self, db_path: str, trace: Optional[Callable[[str], None]] = None):
         """
         Initialize the database manager with the path to the SQLite database.
 
@@ -19,83 +173,475 @@ class DatabaseManager:
         ----------
         db_path : str
             Path to the SQLite database file.
+        trace : Optional[Callable[[str], None]]
+            Called with the text of every statement executed on any of the
+            manager's connections. Useful for spotting repeated queries.
         """
         self.db_path = db_path
+        self._trace = trace
+        # One connection per thread, plus every connection opened so far so
+        # that close() can reach the ones owned by other threads.
+        self._local = threading.local()
+        self._connections: List[Connection] = []
+        self._connections_lock = threading.Lock()
+        # In-process copy of the small, rarely written Professors table and
+        # the derived ID -> "First Last" names, rebuilt lazily after writes.
+        self._professors = None
+        self._professor_names = None
+        # Course rows grouped by ProfessorID, rebuilt lazily after course writes.
+        self._courses_by_professor = None
+        # Bumped by every invalidation. A loader only stores what it read if
+        # the generation is unchanged, so a load that began before a commit
+        # cannot put the old data back once the commit has invalidated it.
+        self._professors_generation = 0
+        self._courses_generation = 0
+        self._cache_lock = threading.Lock()
 
     def get_connection(self) -> Connection:
         """
-        Create and return a connection to the SQLite database.
+        Return the calling thread's connection, opening it on first use.
+
+        The connection is kept open for the lifetime of the manager so that
+        the CRUD methods do not pay the connect/close cost on every call.
 
         Returns
         -------
         Connection
             A SQLite3 connection object.
         """
-        return sqlite3.connect(self.db_path)
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(
+                self.db_path,
+                check_same_thread=False,
+                cached_statements=self.STATEMENT_CACHE_SIZE,
+            )
+            conn.row_factory = sqlite3.Row
+            self._configure(conn)
+            self._local.conn = conn
+            with self._connections_lock:
+                self._connections.append(conn)
+        return conn
+
+    def _configure(self, conn: Connection):
+        """
+        Apply the connection-level PRAGMAs to a freshly opened connection and
+        install the trace callback, if any.
+
+        WAL lets readers run alongside a writer and, together with
+        ``synchronous=NORMAL``, avoids an fsync on every commit.
+
+        Parameters
+        ----------
+        conn : Connection
+            The connection to configure.
+        """
+        for pragma in self.CONNECTION_PRAGMAS:
+            conn.execute(pragma)
+        if self._trace is not None:
+            conn.set_trace_callback(self._trace)
+
+    @contextmanager
+    def transaction(self) -> Iterator[Connection]:
+        """
+        Run the enclosed writes in a single transaction on this thread's
+        connection, committing once at the end.
+
+        The write lock is taken up front with BEGIN IMMEDIATE. Transactions
+        opened inside another one join it, so the CRUD methods can be grouped
+        and share one commit::
+
+            with db_manager.transaction():
+                db_manager.update_course(course_id, name=name)
+                db_manager.enroll_student_in_course(student_id, course_id)
+
+        Yields
+        ------
+        Connection
+            The connection the transaction runs on.
+        """
+        conn = self.get_connection()
+        depth = getattr(self._local, "transaction_depth", 0)
+        self._local.transaction_depth = depth + 1
+        try:
+            if depth:
+                yield conn
+                return
+            self._local.after_commit = []
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                yield conn
+            except BaseException:
+                conn.rollback()
+                raise
+            conn.commit()
+            for callback in self._local.after_commit:
+                callback()
+        finally:
+            self._local.transaction_depth = depth
+            if not depth:
+                self._local.after_commit = []
+
+    def _after_commit(self, callback: Callable[[], None]):
+        """
+        Run callback once the transaction open on this thread has committed.
+
+        Cache invalidation goes through here: dropping a cache before the
+        commit would let another thread reload it from the old data.
+
+        Parameters
+        ----------
+        callback : Callable[[], None]
+            Called with no arguments after the outermost commit. It is not
+            called if the transaction rolls back.
+        """
+        self._local.after_commit.append(callback)
+
+    def _iter_rows(self, sql: str, params: Tuple = ()) -> Iterator[sqlite3.Row]:
+        """
+        Execute a query and yield its rows in chunks of FETCH_ARRAYSIZE.
+
+        Parameters
+        ----------
+        sql : str
+            The query to execute.
+        params : Tuple, optional
+            Parameters bound to the query.
+
+        Yields
+        ------
+        sqlite3.Row
+            One row of the result set at a time.
+        """
+        cursor = self.get_connection().execute(sql, params)
+        cursor.arraysize = self.FETCH_ARRAYSIZE
+        try:
+            rows = cursor.fetchmany()
+            while rows:
+                yield from rows
+                rows = cursor.fetchmany()
+        finally:
+            cursor.close()
+
+    def _get_professors(self) -> Dict[int, sqlite3.Row]:
+        """
+        Return the cached Professors table, loading it on first use.
+
+        Returns
+        -------
+        Dict[int, sqlite3.Row]
+            Professor rows keyed by ProfessorID, in ProfessorID order.
+        """
+        professors = self._professors
+        if professors is None:
+            generation = self._professors_generation
+            professors = {
+                row["ProfessorID"]: row
+                for row in self._iter_rows(
+                    f"SELECT {self.PROFESSOR_COLUMNS} FROM Professors"
+                    " ORDER BY ProfessorID"
+                )
+            }
+            with self._cache_lock:
+                if generation == self._professors_generation:
+                    self._professors = professors
+        return professors
+
+    def _get_professor_names(self) -> Dict[int, str]:
+        """
+        Return the cached mapping of professor IDs to display names.
+
+        Returns
+        -------
+        Dict[int, str]
+            Professor ID mapped to "FirstName LastName".
+        """
+        professor_names = self._professor_names
+        if professor_names is None:
+            generation = self._professors_generation
+            professor_names = {
+                professor_id: f"{row['FirstName']} {row['LastName']}"
+                for professor_id, row in self._get_professors().items()
+            }
+            with self._cache_lock:
+                if generation == self._professors_generation:
+                    self._professor_names = professor_names
+        return professor_names
+
+    def _invalidate_professors(self):
+        """
+        Drop the cached professor data after the Professors table changes.
+        """
+        with self._cache_lock:
+            self._professors_generation += 1
+            self._professors = None
+            self._professor_names = None
+
+    def _get_courses_by_professor(self) -> Dict[int, List[Tuple]]:
+        """
+        Return the cached courses of every professor, loading them on first use.
+
+        Returns
+        -------
+        Dict[int, List[Tuple]]
+            ProfessorID mapped to (Name, StartDate, EndDate, CreditHours)
+            rows in CourseID order.
+        """
+        courses_by_professor = self._courses_by_professor
+        if courses_by_professor is None:
+            generation = self._courses_generation
+            courses_by_professor = {}
+            for row in self._iter_rows(
+                """
+                SELECT ProfessorID, Name, StartDate, EndDate, CreditHours
+                FROM Courses
+                ORDER BY CourseID
+            """
+            ):
+                courses_by_professor.setdefault(row["ProfessorID"], []).append(row[1:])
+            with self._cache_lock:
+                if generation == self._courses_generation:
+                    self._courses_by_professor = courses_by_professor
+        return courses_by_professor
+
+    def _invalidate_courses(self):
+        """
+        Drop the cached course data after the Courses table changes.
+        """
+        with self._cache_lock:
+            self._courses_generation += 1
+            self._courses_by_professor = None
+
+    def close(self):
+        """
+        Close every connection the manager has opened, in any thread.
+        """
+        with self._connections_lock:
+            connections, self._connections = self._connections, []
+            self._local = threading.local()
+        for conn in connections:
+            conn.close()
 
     def initialize_database(self):
         """
         Initialize the database by creating tables if they do not exist.
+
+        Databases already at SCHEMA_VERSION skip the migration steps, so a
+        normal startup costs a PRAGMA read and the index checks. The indexes
+        are always ensured, since a bulk load drops and rebuilds them.
         """
         conn = self.get_connection()
-        cursor = conn.cursor()
+        version = self.get_schema_version()
+        if version < self.SCHEMA_VERSION:
+            self._upgrade_schema(conn, version)
+
+        # No-ops when the indexes exist
+        for index_sql in self.INDEX_DEFINITIONS.values():
+            conn.execute(index_sql)
+
+    def _upgrade_schema(self, conn: Connection, version: int):
+        """
+        Create missing tables and migrate existing ones to SCHEMA_VERSION.
+
+        Parameters
+        ----------
+        conn : Connection
+        version : int
+            The schema version currently recorded in the database.
+        """
+        existing_tables = {
+            row[0]
+            for row in conn.execute(
+                "SELECT name FROM sqlite_master WHERE type = 'table'"
+            )
+        }
 
         # Create tables
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS Students (
-                StudentID INTEGER PRIMARY KEY AUTOINCREMENT,
-                FirstName TEXT NOT NULL,
-                LastName TEXT NOT NULL,
-                Age INTEGER,
-                DegreeProgram TEXT,
-                CompletedCredits INTEGER,
-                GPA REAL
-            );
+        for table in self.TABLE_DEFINITIONS:
+            conn.execute(self._table_sql(table))
+
+        # Tables from before version 2 may still use AUTOINCREMENT and lack
+        # the STRICT/WITHOUT ROWID options; rebuild them from the current
+        # definitions.
+        if version < 2:
+            for table in self.TABLE_DEFINITIONS:
+                if table in existing_tables:
+                    self._rebuild_table(conn, table)
+
+        # Before version 3 deletes left dependent rows behind; clear them so
+        # records that reuse a freed ID do not inherit them.
+        if version < 3:
+            with conn:
+                conn.execute(
+                    "DELETE FROM Enrollments"
+                    " WHERE StudentID NOT IN (SELECT StudentID FROM Students)"
+                    " OR CourseID NOT IN (SELECT CourseID FROM Courses)"
+                )
+                conn.execute(
+                    "UPDATE Courses SET ProfessorID = NULL"
+                    " WHERE ProfessorID NOT IN (SELECT ProfessorID FROM Professors)"
+                )
+
+        conn.execute(f"PRAGMA user_version = {self.SCHEMA_VERSION}")
+        conn.commit()
+
+    def get_schema_version(self) -> int:
         """
-        )
+        Return the schema version recorded in the database file.
 
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS Professors (
-                ProfessorID INTEGER PRIMARY KEY AUTOINCREMENT,
-                FirstName TEXT NOT NULL,
-                LastName TEXT NOT NULL,
-                Department TEXT,
-                AcademicAchievement TEXT
-            );
+        Returns
+        -------
+        int
+            The value of PRAGMA user_version; 0 for a new database.
         """
-        )
+        return self.get_connection().execute("PRAGMA user_version").fetchone()[0]
 
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS Courses (
-                CourseID INTEGER PRIMARY KEY AUTOINCREMENT,
-                StartDate TEXT,
-                EndDate TEXT,
-                Name TEXT NOT NULL,
-                CreditHours INTEGER,
-                ProfessorID INTEGER,
-                FOREIGN KEY (ProfessorID) REFERENCES Professors(ProfessorID)
-            );
+    def _table_sql(self, table: str, name: Optional[str] = None) -> str:
         """
-        )
+        Build the CREATE TABLE statement for a table in TABLE_DEFINITIONS.
 
-        cursor.execute(
-            """
-            CREATE TABLE IF NOT EXISTS Enrollments (
-                StudentID INTEGER,
-                CourseID INTEGER,
-                Grade TEXT,
-                PRIMARY KEY (StudentID, CourseID),
-                FOREIGN KEY (StudentID) REFERENCES Students(StudentID),
-                FOREIGN KEY (CourseID) REFERENCES Courses(CourseID)
-            );
+        STRICT is only added when the SQLite library supports it (3.37+).
+
+        Parameters
+        ----------
+        table : str
+            Name of a table in TABLE_DEFINITIONS.
+        name : str, optional
+            Name to create the table under; defaults to ``table``.
+
+        Returns
+        -------
+        str
+            The CREATE TABLE statement.
         """
+        options = []
+        if table in self.WITHOUT_ROWID_TABLES:
+            options.append("WITHOUT ROWID")
+        if sqlite3.sqlite_version_info >= (3, 37, 0):
+            options.append("STRICT")
+        return self.TABLE_DEFINITIONS[table].format(
+            table=name or table, options=", ".join(options)
         )
 
-        conn.commit()
-        conn.close()
+    def _rebuild_table(self, conn: Connection, table: str):
+        """
+        Recreate a table from its current definition, keeping its rows.
+
+        The new table is built under a temporary name and swapped in, so
+        foreign key references from other tables keep pointing at it.
+
+        Without STRICT, SQLite stored whatever it was given, such as '' in
+        an INTEGER column. Values that do not fit the column type are copied
+        as NULL, and rows left without a required value are dropped, so the
+        copy into the stricter table cannot fail.
+
+        Parameters
+        ----------
+        conn : Connection
+        table : str
+            Name of a table in TABLE_DEFINITIONS.
+        """
+        new_table = f"{table}_new"
+        with conn:
+            conn.execute("BEGIN")
+            conn.execute(self._table_sql(table, new_table))
+            old_columns = {
+                row[1] for row in conn.execute(f"PRAGMA table_info({table})")
+            }
+            columns, values, required = [], [], []
+            for _, name, col_type, not_null, _, _ in conn.execute(
+                f"PRAGMA table_info({new_table})"
+            ):
+                if name not in old_columns:
+                    continue
+                columns.append(name)
+                values.append(self._cleanup_sql(name, col_type))
+                if not_null:
+                    required.append(f"{values[-1]} IS NOT NULL")
+            where = f" WHERE {' AND '.join(required)}" if required else ""
+            conn.execute(
+                f"INSERT INTO {new_table} ({', '.join(columns)})"
+                f" SELECT {', '.join(values)} FROM {table}{where}"
+            )
+            conn.execute(f"DROP TABLE {table}")
+            conn.execute(f"ALTER TABLE {new_table} RENAME TO {table}")
+
+    @staticmethod
+    def _cleanup_sql(column: str, col_type: str) -> str:
+        """
+        Build an expression that converts a column's value to its declared type.
+
+        Parameters
+        ----------
+        column : str
+        col_type : str
+            Declared type of the column: INTEGER, REAL or TEXT.
+
+        Returns
+        -------
+        str
+            SQL expression giving the converted value, or NULL for numeric
+            columns holding something that is not a number.
+        """
+        if col_type in ("INTEGER", "REAL"):
+            return (
+                f"CASE WHEN typeof({column}) IN ('integer', 'real')"
+                f" THEN CAST({column} AS {col_type}) END"
+            )
+        return f"CAST({column} AS {col_type})"
+
+    def _update_row(
+        self,
+        table: str,
+        key_column: str,
+        key: int,
+        columns: Dict[str, str],
+        fields: Dict[str, object],
+        returning: str,
+    ) -> Optional[sqlite3.Row]:
+        """
+        Write only the given fields of one row, leaving other columns untouched,
+        and return the row as stored afterwards.
+
+        Parameters
+        ----------
+        table : str
+        key_column : str
+            Primary key column identifying the row.
+        key : int
+        columns : Dict[str, str]
+            Whitelist mapping accepted field names to column names.
+        fields : Dict[str, object]
+            Field name to new value.
+        returning : str
+            Comma-separated columns to return from the updated row.
+
+        Returns
+        -------
+        Optional[sqlite3.Row]
+            The updated row, or None if no row has the given key.
+
+        Raises
+        ------
+        ValueError
+            If a field name is not in the whitelist.
+        """
+        unknown = set(fields) - set(columns)
+        if unknown:
+            raise ValueError(f"Unknown {table} fields: {', '.join(sorted(unknown))}")
+        select_sql = f"SELECT {returning} FROM {table} WHERE {key_column} = ?"
+        if not fields:
+            return self.get_connection().execute(select_sql, (key,)).fetchone()
+        assignments = ", ".join(f"{columns[name]} = ?" for name in fields)
+        update_sql = f"UPDATE {table} SET {assignments} WHERE {key_column} = ?"
+        with self.transaction() as conn:
+            if self.HAS_RETURNING:
+                # The updated row comes back from the UPDATE itself
+                return conn.execute(
+                    f"{update_sql} RETURNING {returning}", (*fields.values(), key)
+                ).fetchone()
+            conn.execute(update_sql, (*fields.values(), key))
+            return conn.execute(select_sql, (key,)).fetchone()
 
     # CRUD Operations for Students
     def create_student(
@@ -106,7 +652,7 @@ class DatabaseManager:
         degree_program: str,
         completed_credits: int,
         gpa: float,
-    ):
+    ) -> int:
         """
         Create a new student record in the database.
 
@@ -118,20 +664,40 @@ class DatabaseManager:
         degree_program : str
         completed_credits : int
         gpa : float
-        """
-        conn = self.get_connection()
-        cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT INTO Students (FirstName, LastName, Age, DegreeProgram, CompletedCredits, GPA)
-            VALUES (?, ?, ?, ?, ?, ?)
-        """,
-            (first_name, last_name, age, degree_program, completed_credits, gpa),
-        )
+        Returns
+        -------
+        int
+            The StudentID of the new record.
+        """
+        with self.transaction() as conn:
+            cursor = conn.execute(
+                """
+                INSERT INTO Students (FirstName, LastName, Age, DegreeProgram, CompletedCredits, GPA)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                (first_name, last_name, age, degree_program, completed_credits, gpa),
+            )
+        return cursor.lastrowid
+
+    def create_students_bulk(self, rows: Iterable[Tuple]):
+        """
+        Create many student records in a single transaction.
 
-        conn.commit()
-        conn.close()
+        Parameters
+        ----------
+        rows : Iterable[Tuple]
+            Tuples of (first_name, last_name, age, degree_program,
+            completed_credits, gpa).
+        """
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO Students (FirstName, LastName, Age, DegreeProgram, CompletedCredits, GPA)
+                VALUES (?, ?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
 
     def read_student(self, student_id: int):
         """
@@ -143,64 +709,42 @@ class DatabaseManager:
 
         Returns
         -------
-        dict
-            A dictionary containing the student's data.
+        sqlite3.Row
+            The student's data, accessible by index or by column name.
         """
         conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM Students WHERE StudentID = ?", (student_id,))
-        student = cursor.fetchone()
+        student = conn.execute(
+            f"SELECT {self.STUDENT_COLUMNS} FROM Students WHERE StudentID = ?",
+            (student_id,),
+        ).fetchone()
 
-        conn.close()
         return student
 
-    def update_student(
-        self,
-        student_id: int,
-        first_name: str,
-        last_name: str,
-        age: int,
-        degree_program: str,
-        completed_credits: int,
-        gpa: float,
-    ):
+    def update_student(self, student_id: int, **fields):
         """
-        Update a student record in the database.
+        Update the given columns of a student record in the database.
 
         Parameters
         ----------
         student_id : int
-        first_name : str
-        last_name : str
-        age : int
-        degree_program : str
-        completed_credits : int
-        gpa : float
-        """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        **fields
+            Any of first_name, last_name, age, degree_program,
+            completed_credits and gpa. Columns not passed are left unchanged.
 
-        cursor.execute(
-            """
-            UPDATE Students
-            SET FirstName = ?, LastName = ?, Age = ?, DegreeProgram = ?, CompletedCredits = ?, GPA = ?
-            WHERE StudentID = ?
-        """,
-            (
-                first_name,
-                last_name,
-                age,
-                degree_program,
-                completed_credits,
-                gpa,
-                student_id,
-            ),
+        Returns
+        -------
+        Optional[sqlite3.Row]
+            The updated student, or None if there is no such student.
+        """
+        return self._update_row(
+            "Students",
+            "StudentID",
+            student_id,
+            self.STUDENT_FIELDS,
+            fields,
+            self.STUDENT_COLUMNS,
         )
 
-        conn.commit()
-        conn.close()
-
     def delete_student(self, student_id: int):
         """
         Delete a student record from the database.
@@ -209,13 +753,27 @@ class DatabaseManager:
         ----------
         student_id : int
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self.transaction() as conn:
+            # IDs can be reused once deleted, so the student's enrollments
+            # must go with it rather than pass on to a later student.
+            conn.execute("DELETE FROM Enrollments WHERE StudentID = ?", (student_id,))
+            conn.execute("DELETE FROM Students WHERE StudentID = ?", (student_id,))
 
-        cursor.execute("DELETE FROM Students WHERE StudentID = ?", (student_id,))
+    def iter_all_students(self) -> Iterator[sqlite3.Row]:
+        """
+        Streams all student records from the database.
 
-        conn.commit()
-        conn.close()
+        Yields
+        ------
+        sqlite3.Row
+            One student record at a time.
+        """
+        yield from self._iter_rows(
+            """
+            SELECT StudentID, FirstName, LastName, Age, DegreeProgram, CompletedCredits, GPA
+            FROM Students
+        """
+        )
 
     def list_all_students(self):
         """
@@ -224,52 +782,142 @@ class DatabaseManager:
         Returns
         -------
         list
-            A list of tuples, each representing a student record.
+            A list of rows, each representing a student record.
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        return list(self.iter_all_students())
 
-        cursor.execute("SELECT * FROM Students")
-        students_data = cursor.fetchall()
+    def list_students_after(
+        self, last_student_id: int, limit: int
+    ) -> List[sqlite3.Row]:
+        """
+        Retrieves the next page of students in StudentID order.
 
-        conn.close()
-        return students_data
+        Pages are found by key rather than OFFSET, so each one costs the same
+        however deep into the table it is.
 
-    def enroll_student_in_course(self, student_id: int, course_id: int):
-        """
-        Enrolls a student in a course in the database.
+        Parameters
+        ----------
+        last_student_id : int
+            The highest StudentID of the previous page, or 0 for the first.
+        limit : int
+            The maximum number of students to return.
+
+        Returns
+        -------
+        List[sqlite3.Row]
+            The student records with a StudentID above last_student_id.
         """
         conn = self.get_connection()
-        cursor = conn.cursor()
-        # cursor.execute("""
-        #     INSERT INTO Enrollments (StudentID, CourseID, StartDate)
-        #     VALUES (?, ?, ?)
-        # """, (student_id, course_id, start_date))
-        cursor.execute(
+        return conn.execute(
             """
-            INSERT INTO Enrollments (StudentID, CourseID)
-            VALUES (?, ?)
+            SELECT StudentID, FirstName, LastName, Age, DegreeProgram, CompletedCredits, GPA
+            FROM Students
+            WHERE StudentID > ?
+            ORDER BY StudentID
+            LIMIT ?
         """,
-            (student_id, course_id),
+            (last_student_id, limit),
+        ).fetchall()
+
+    def count_students(self) -> int:
+        """
+        Returns the number of student records in the database.
+        """
+        return (
+            self.get_connection().execute("SELECT COUNT(*) FROM Students").fetchone()[0]
         )
-        conn.commit()
-        conn.close()
+
+    def enroll_student_in_course(self, student_id: int, course_id: int) -> bool:
+        """
+        Enrolls a student in a course in the database.
+
+        Returns
+        -------
+        bool
+            False if the student was already enrolled in the course.
+        """
+        with self.transaction() as conn:
+            # cursor.execute("""
+            #     INSERT INTO Enrollments (StudentID, CourseID, StartDate)
+            #     VALUES (?, ?, ?)
+            # """, (student_id, course_id, start_date))
+            cursor = conn.execute(
+                """
+                INSERT OR IGNORE INTO Enrollments (StudentID, CourseID)
+                VALUES (?, ?)
+            """,
+                (student_id, course_id),
+            )
+        return cursor.rowcount > 0
 
     def remove_student_from_course(self, student_id: int, course_id: int):
         """
         Removes a student from a course in the database.
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
-            """
-            DELETE FROM Enrollments
-            WHERE StudentID = ? AND CourseID = ?
-        """,
-            (student_id, course_id),
-        )
-        conn.commit()
-        conn.close()
+        with self.transaction() as conn:
+            conn.execute(
+                """
+                DELETE FROM Enrollments
+                WHERE StudentID = ? AND CourseID = ?
+            """,
+                (student_id, course_id),
+            )
+
+    def enroll_student_in_courses(self, student_id: int, course_ids: Iterable[int]):
+        """
+        Enrolls a student in several courses in a single transaction.
+
+        Courses the student is already enrolled in are skipped.
+
+        Parameters
+        ----------
+        student_id : int
+        course_ids : Iterable[int]
+        """
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT OR IGNORE INTO Enrollments (StudentID, CourseID)
+                VALUES (?, ?)
+            """,
+                [(student_id, course_id) for course_id in course_ids],
+            )
+
+    def remove_student_from_courses(self, student_id: int, course_ids: Iterable[int]):
+        """
+        Removes a student from several courses in a single transaction.
+
+        Parameters
+        ----------
+        student_id : int
+        course_ids : Iterable[int]
+        """
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                DELETE FROM Enrollments
+                WHERE StudentID = ? AND CourseID = ?
+            """,
+                [(student_id, course_id) for course_id in course_ids],
+            )
+
+    def enroll_students_bulk(self, rows: Iterable[Tuple]):
+        """
+        Create many enrollment records in a single transaction.
+
+        Parameters
+        ----------
+        rows : Iterable[Tuple]
+            Tuples of (student_id, course_id).
+        """
+        with self.transaction() as conn:
+            conn.executemany(
+                """
+                INSERT INTO Enrollments (StudentID, CourseID)
+                VALUES (?, ?)
+            """,
+                rows,
+            )
 
     # CRUD Operations for Professors
     def create_professor(
@@ -278,7 +926,7 @@ class DatabaseManager:
         last_name: str,
         department: str,
         academic_achievement: str,
-    ):
+    ) -> int:
         """
         Create a new professor record in the database.
 
@@ -288,24 +936,45 @@ class DatabaseManager:
         last_name : str
         department : str
         academic_achievement : str
-        """
-        conn = self.get_connection()
-        cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT INTO Professors (FirstName, LastName, Department, AcademicAchievement)
-            VALUES (?, ?, ?, ?)
-        """,
-            (first_name, last_name, department, academic_achievement),
-        )
+        Returns
+        -------
+        int
+            The ProfessorID of the new record.
+        """
+        with self.transaction() as conn:
+            self._after_commit(self._invalidate_professors)
+            cursor = conn.execute(
+                """
+                INSERT INTO Professors (FirstName, LastName, Department, AcademicAchievement)
+                VALUES (?, ?, ?, ?)
+            """,
+                (first_name, last_name, department, academic_achievement),
+            )
+        return cursor.lastrowid
+
+    def create_professors_bulk(self, rows: Iterable[Tuple]):
+        """
+        Create many professor records in a single transaction.
 
-        conn.commit()
-        conn.close()
+        Parameters
+        ----------
+        rows : Iterable[Tuple]
+            Tuples of (first_name, last_name, department, academic_achievement).
+        """
+        with self.transaction() as conn:
+            self._after_commit(self._invalidate_professors)
+            conn.executemany(
+                """
+                INSERT INTO Professors (FirstName, LastName, Department, AcademicAchievement)
+                VALUES (?, ?, ?, ?)
+            """,
+                rows,
+            )
 
     def read_professor(self, professor_id: int):
         """
-        Read a professor record from the database.
+        Read a professor record from the in-process professor cache.
 
         Parameters
         ----------
@@ -313,69 +982,86 @@ class DatabaseManager:
 
         Returns
         -------
-        dict
-            A dictionary containing the professor's data.
+        sqlite3.Row
+            The professor's data, accessible by index or by column name.
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        return self._get_professors().get(professor_id)
 
-        cursor.execute(
-            "SELECT * FROM Professors WHERE ProfessorID = ?", (professor_id,)
-        )
-        professor = cursor.fetchone()
-
-        conn.close()
-        return professor
-
-    def update_professor(
-        self,
-        professor_id: int,
-        first_name: str,
-        last_name: str,
-        department: str,
-        academic_achievement: str,
-    ):
+    def update_professor(self, professor_id: int, **fields):
         """
-        Update a professor record in the database.
+        Update the given columns of a professor record in the database.
 
         Parameters
         ----------
         professor_id : int
-        first_name : str
-        last_name : str
-        department : str
-        academic_achievement : str
-        """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            UPDATE Professors
-            SET FirstName = ?, LastName = ?, Department = ?, AcademicAchievement = ?
-            WHERE ProfessorID = ?
-        """,
-            (first_name, last_name, department, academic_achievement, professor_id),
-        )
+        **fields
+            Any of first_name, last_name, department and academic_achievement.
+            Columns not passed are left unchanged.
 
-        conn.commit()
-        conn.close()
+        Returns
+        -------
+        Optional[sqlite3.Row]
+            The updated professor, or None if there is no such professor.
+        """
+        with self.transaction():
+            self._after_commit(self._invalidate_professors)
+            return self._update_row(
+                "Professors",
+                "ProfessorID",
+                professor_id,
+                self.PROFESSOR_FIELDS,
+                fields,
+                self.PROFESSOR_COLUMNS,
+            )
 
     def delete_professor(self, professor_id: int):
         """
         Delete a professor record from the database.
 
+        Courses taught by the professor are kept but left without a
+        professor, so a later professor given the same ID does not take
+        them over.
+
         Parameters
         ----------
         professor_id : int
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self.transaction() as conn:
+            self._after_commit(self._invalidate_professors)
+            self._after_commit(self._invalidate_courses)
+            conn.execute(
+                "UPDATE Courses SET ProfessorID = NULL WHERE ProfessorID = ?",
+                (professor_id,),
+            )
+            conn.execute(
+                "DELETE FROM Professors WHERE ProfessorID = ?", (professor_id,)
+            )
+
+    def get_professor_name(self, professor_id: int) -> Optional[str]:
+        """
+        Look up a professor's display name in the in-process professor cache.
 
-        cursor.execute("DELETE FROM Professors WHERE ProfessorID = ?", (professor_id,))
+        Parameters
+        ----------
+        professor_id : int
 
-        conn.commit()
-        conn.close()
+        Returns
+        -------
+        Optional[str]
+            "FirstName LastName", or None if there is no such professor.
+        """
+        return self._get_professor_names().get(professor_id)
+
+    def iter_all_professors(self) -> Iterator[sqlite3.Row]:
+        """
+        Streams all professor records from the in-process professor cache.
+
+        Yields
+        ------
+        sqlite3.Row
+            One professor record at a time.
+        """
+        yield from self._get_professors().values()
 
     def list_all_professors(self):
         """
@@ -384,16 +1070,15 @@ class DatabaseManager:
         Returns
         -------
         list
-            A list of tuples, each representing a professor record.
+            A list of rows, each representing a professor record.
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM Professors")
-        professors_data = cursor.fetchall()
+        return list(self.iter_all_professors())
 
-        conn.close()
-        return professors_data
+    def count_professors(self) -> int:
+        """
+        Returns the number of professor records, read from the professor cache.
+        """
+        return len(self._get_professors())
 
     # CRUD Operations for Courses
     def create_course(
@@ -403,7 +1088,7 @@ class DatabaseManager:
         name: str,
         credit_hours: int,
         professor_id: int,
-    ):
+    ) -> int:
         """
         Create a new course record in the database.
 
@@ -414,20 +1099,41 @@ class DatabaseManager:
         name : str
         credit_hours : int
         professor_id : int
-        """
-        conn = self.get_connection()
-        cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            INSERT INTO Courses (StartDate, EndDate, Name, CreditHours, ProfessorID)
-            VALUES (?, ?, ?, ?, ?)
-        """,
-            (start_date, end_date, name, credit_hours, professor_id),
-        )
+        Returns
+        -------
+        int
+            The CourseID of the new record.
+        """
+        with self.transaction() as conn:
+            self._after_commit(self._invalidate_courses)
+            cursor = conn.execute(
+                """
+                INSERT INTO Courses (StartDate, EndDate, Name, CreditHours, ProfessorID)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                (start_date, end_date, name, credit_hours, professor_id),
+            )
+        return cursor.lastrowid
+
+    def create_courses_bulk(self, rows: Iterable[Tuple]):
+        """
+        Create many course records in a single transaction.
 
-        conn.commit()
-        conn.close()
+        Parameters
+        ----------
+        rows : Iterable[Tuple]
+            Tuples of (start_date, end_date, name, credit_hours, professor_id).
+        """
+        with self.transaction() as conn:
+            self._after_commit(self._invalidate_courses)
+            conn.executemany(
+                """
+                INSERT INTO Courses (StartDate, EndDate, Name, CreditHours, ProfessorID)
+                VALUES (?, ?, ?, ?, ?)
+            """,
+                rows,
+            )
 
     def read_course(self, course_id: int):
         """
@@ -439,53 +1145,43 @@ class DatabaseManager:
 
         Returns
         -------
-        dict
-            A dictionary containing the course's data.
+        sqlite3.Row
+            The course's data, accessible by index or by column name.
         """
         conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute("SELECT * FROM Courses WHERE CourseID = ?", (course_id,))
-        course = cursor.fetchone()
+        course = conn.execute(
+            f"SELECT {self.COURSE_COLUMNS} FROM Courses WHERE CourseID = ?",
+            (course_id,),
+        ).fetchone()
 
-        conn.close()
         return course
 
-    def update_course(
-        self,
-        course_id: int,
-        start_date: str,
-        end_date: str,
-        name: str,
-        credit_hours: int,
-        professor_id: int,
-    ):
+    def update_course(self, course_id: int, **fields):
         """
-        Update a course record in the database.
+        Update the given columns of a course record in the database.
 
         Parameters
         ----------
         course_id : int
-        start_date : str
-        end_date : str
-        name : str
-        credit_hours : int
-        professor_id : int
-        """
-        conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
-            """
-            UPDATE Courses
-            SET StartDate = ?, EndDate = ?, Name = ?, CreditHours = ?, ProfessorID = ?
-            WHERE CourseID = ?
-        """,
-            (start_date, end_date, name, credit_hours, professor_id, course_id),
-        )
+        **fields
+            Any of start_date, end_date, name, credit_hours and professor_id.
+            Columns not passed are left unchanged.
 
-        conn.commit()
-        conn.close()
+        Returns
+        -------
+        Optional[sqlite3.Row]
+            The updated course, or None if there is no such course.
+        """
+        with self.transaction():
+            self._after_commit(self._invalidate_courses)
+            return self._update_row(
+                "Courses",
+                "CourseID",
+                course_id,
+                self.COURSE_FIELDS,
+                fields,
+                self.COURSE_COLUMNS,
+            )
 
     def delete_course(self, course_id: int):
         """
@@ -495,13 +1191,26 @@ class DatabaseManager:
         ----------
         course_id : int
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        with self.transaction() as conn:
+            self._after_commit(self._invalidate_courses)
+            conn.execute("DELETE FROM Enrollments WHERE CourseID = ?", (course_id,))
+            conn.execute("DELETE FROM Courses WHERE CourseID = ?", (course_id,))
+
+    def iter_all_courses(self) -> Iterator[Tuple]:
+        """
+        Streams all course records from the database, including the professor's name.
 
-        cursor.execute("DELETE FROM Courses WHERE CourseID = ?", (course_id,))
+        The professor's name is looked up in the cached name mapping rather
+        than concatenated by SQLite for every row.
 
-        conn.commit()
-        conn.close()
+        Yields
+        ------
+        Tuple
+            One course record with the professor's name at a time.
+        """
+        professor_names = self._get_professor_names()
+        for row in self._iter_rows(self.LIST_ALL_COURSES_SQL):
+            yield (*row, professor_names.get(row["ProfessorID"]))
 
     def list_all_courses(self):
         """
@@ -512,21 +1221,44 @@ class DatabaseManager:
         list
             A list of tuples, each representing a course record with the professor's name.
         """
-        conn = self.get_connection()
-        cursor = conn.cursor()
+        return list(self.iter_all_courses())
 
-        cursor.execute(
-            """
-            SELECT c.CourseID, c.Name, c.StartDate, c.EndDate, c.CreditHours, c.ProfessorID, p.FirstName || ' ' || p.LastName as ProfessorName
-            FROM Courses c
-            LEFT JOIN Professors p ON c.ProfessorID = p.ProfessorID
+    def count_courses(self) -> int:
+        """
+        Returns the number of course records in the database.
         """
+        return (
+            self.get_connection().execute("SELECT COUNT(*) FROM Courses").fetchone()[0]
         )
 
-        courses_data = cursor.fetchall()
+    def list_courses_after(self, last_course_id: int, limit: int) -> List[Tuple]:
+        """
+        Retrieves the next page of courses in CourseID order, including the
+        professor's name.
 
-        conn.close()
-        return courses_data
+        Parameters
+        ----------
+        last_course_id : int
+            The highest CourseID of the previous page, or 0 for the first.
+        limit : int
+            The maximum number of courses to return.
+
+        Returns
+        -------
+        List[Tuple]
+            The course records with a CourseID above last_course_id.
+        """
+        professor_names = self._get_professor_names()
+        rows = (
+            self.get_connection()
+            .execute(
+                self.LIST_ALL_COURSES_SQL
+                + "WHERE CourseID > ? ORDER BY CourseID LIMIT ?",
+                (last_course_id, limit),
+            )
+            .fetchall()
+        )
+        return [(*row, professor_names.get(row["ProfessorID"])) for row in rows]
 
     def get_courses_for_student(self, student_id: int):
         """
@@ -543,9 +1275,7 @@ class DatabaseManager:
             A list of courses the student is enrolled in, including additional details.
         """
         conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
+        courses_data = conn.execute(
             """
             SELECT c.CourseID, c.Name, c.StartDate, c.EndDate, c.CreditHours, p.FirstName || ' ' || p.LastName as ProfessorName
             FROM Courses c
@@ -554,42 +1284,62 @@ class DatabaseManager:
             WHERE e.StudentID = ?
         """,
             (student_id,),
-        )
+        ).fetchall()
 
-        courses_data = cursor.fetchall()
-
-        conn.close()
         return courses_data
 
-    def get_courses_for_professor(self, professor_id: int):
+    def get_courses_for_students(
+        self, student_ids: Sequence[int]
+    ) -> Dict[int, List[sqlite3.Row]]:
         """
-        Retrieves courses taught by a given professor from the database.
+        Retrieves courses for several students at once.
 
         Parameters
         ----------
-        professor_id : int
+        student_ids : Sequence[int]
 
         Returns
         -------
-        list
-            A list of courses taught by the professor.
+        Dict[int, List[sqlite3.Row]]
+            Each requested student ID mapped to its courses, with the same
+            columns as get_courses_for_student returns followed by StudentID.
         """
+        courses_by_student = {student_id: [] for student_id in student_ids}
         conn = self.get_connection()
-        cursor = conn.cursor()
 
-        cursor.execute(
-            """
-            SELECT c.Name, c.StartDate, c.EndDate, c.CreditHours
-            FROM Courses c
-            WHERE c.ProfessorID = ?
-        """,
-            (professor_id,),
-        )
+        for start in range(0, len(student_ids), self.MAX_BATCH_IDS):
+            batch = student_ids[start : start + self.MAX_BATCH_IDS]
+            placeholders = ",".join("?" * len(batch))
+            cursor = conn.execute(
+                f"""
+                SELECT c.CourseID, c.Name, c.StartDate, c.EndDate, c.CreditHours, p.FirstName || ' ' || p.LastName as ProfessorName, e.StudentID
+                FROM Courses c
+                JOIN Enrollments e ON c.CourseID = e.CourseID
+                LEFT JOIN Professors p ON c.ProfessorID = p.ProfessorID
+                WHERE e.StudentID IN ({placeholders})
+            """,
+                batch,
+            )
+            for row in cursor:
+                courses_by_student[row["StudentID"]].append(row)
+
+        return courses_by_student
 
-        courses_data = cursor.fetchall()
+    def get_courses_for_professor(self, professor_id: int):
+        """
+        Retrieves courses taught by a given professor from the in-process
+        course index.
 
-        conn.close()
-        return courses_data
+        Parameters
+        ----------
+        professor_id : int
+
+        Returns
+        -------
+        list
+            A list of courses taught by the professor.
+        """
+        return list(self._get_courses_by_professor().get(professor_id, ()))
 
     def get_students_for_course(self, course_id: int):
         """
@@ -605,9 +1355,7 @@ class DatabaseManager:
             A list of students enrolled in the course.
         """
         conn = self.get_connection()
-        cursor = conn.cursor()
-
-        cursor.execute(
+        students_data = conn.execute(
             """
             SELECT s.StudentID, s.FirstName, s.LastName
             FROM Students s
@@ -615,13 +1363,46 @@ class DatabaseManager:
             WHERE e.CourseID = ?
         """,
             (course_id,),
-        )
-
-        students_data = cursor.fetchall()
+        ).fetchall()
 
-        conn.close()
         return students_data
 
+    def get_students_for_courses(
+        self, course_ids: Sequence[int]
+    ) -> Dict[int, List[sqlite3.Row]]:
+        """
+        Retrieves the students of several courses at once.
+
+        Parameters
+        ----------
+        course_ids : Sequence[int]
+
+        Returns
+        -------
+        Dict[int, List[sqlite3.Row]]
+            Each requested course ID mapped to its students, with the same
+            columns as get_students_for_course returns followed by CourseID.
+        """
+        students_by_course = {course_id: [] for course_id in course_ids}
+        conn = self.get_connection()
+
+        for start in range(0, len(course_ids), self.MAX_BATCH_IDS):
+            batch = course_ids[start : start + self.MAX_BATCH_IDS]
+            placeholders = ",".join("?" * len(batch))
+            cursor = conn.execute(
+                f"""
+                SELECT s.StudentID, s.FirstName, s.LastName, e.CourseID
+                FROM Students s
+                JOIN Enrollments e ON s.StudentID = e.StudentID
+                WHERE e.CourseID IN ({placeholders})
+            """,
+                batch,
+            )
+            for row in cursor:
+                students_by_course[row["CourseID"]].append(row)
+
+        return students_by_course
+
     def get_course_start_dates(self, course_id: int):
         """
         Retrieves available start dates for a given course from the Courses table.
@@ -636,15 +1417,13 @@ class DatabaseManager:
             A list of start dates.
         """
         conn = self.get_connection()
-        cursor = conn.cursor()
-        cursor.execute(
+        # CourseID is the primary key, so there is at most one start date.
+        row = conn.execute(
             """
             SELECT StartDate
             FROM Courses
             WHERE CourseID = ?
         """,
             (course_id,),
-        )
-        start_dates = [row[0] for row in cursor.fetchall()]
-        conn.close()
-        return start_dates
+        ).fetchone()
+        return [row[0]] if row else []
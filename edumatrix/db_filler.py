@@ -5,21 +5,77 @@ This script generates random data and inserts it into the database.
 
 import random
 import sqlite3
+from itertools import chain, islice
+from typing import Iterable, Optional, Sequence, Tuple
 
 from faker import Faker
 
+from edumatrix.database import DatabaseManager, get_db_path
 
-def main():
+# SQLite's default limit on bound parameters per statement
+MAX_VARIABLES = 999
+
+
+def bulk_insert(
+    cursor: sqlite3.Cursor,
+    table: str,
+    columns: Sequence[str],
+    rows: Iterable[Tuple],
+):
+    """
+    Insert rows using multi-row VALUES clauses, as many rows per statement
+    as the bound-parameter limit allows.
+
+    Parameters
+    ----------
+    cursor : sqlite3.Cursor
+        The cursor to execute the inserts on.
+    table : str
+        Name of the table to insert into.
+    columns : Sequence[str]
+        The columns each row provides values for, in order.
+    rows : Iterable[Tuple]
+        The rows to insert.
+    """
+    per_statement = MAX_VARIABLES // len(columns)
+    placeholders = "(" + ", ".join("?" * len(columns)) + ")"
+    prefix = f"INSERT INTO {table} ({', '.join(columns)}) VALUES "
+    full_sql = prefix + ", ".join([placeholders] * per_statement)
+
+    rows = iter(rows)
+    chunk = list(islice(rows, per_statement))
+    while chunk:
+        if len(chunk) == per_statement:
+            sql = full_sql
+        else:
+            sql = prefix + ", ".join([placeholders] * len(chunk))
+        cursor.execute(sql, list(chain.from_iterable(chunk)))
+        chunk = list(islice(rows, per_statement))
+
+
+def main(seed: Optional[int] = None):
     """
     This function generates random data and inserts it into the database.
+
+    Parameters
+    ----------
+    seed : Optional[int]
+        Seed for the random data, so a run can be reproduced. Each run gets
+        different data when it is None.
     """
     # Initialize the Faker library
     fake = Faker()
+    # All random draws go through one generator instance
+    rng = random.Random(seed)
+    if seed is not None:
+        fake.seed_instance(seed)
 
     # Number of entries to generate
     num_students = 1000
     num_professors = 100
     num_courses = 75
+    # Size of the pools first and last names are drawn from
+    name_pool_size = 200
 
     # Generating lists for random selections
     departments = [
@@ -84,68 +140,118 @@ def main():
         "Urban Studies",
         "Film Studies",
     ]
-    # Connect to SQLite database (or create if it doesn't exist)
-    conn = sqlite3.connect("edumatrix.db")
-    cursor = conn.cursor()
+    # Draw names from a small pool generated once, rather than calling
+    # Faker for every row
+    first_names = [fake.first_name() for _ in range(name_pool_size)]
+    last_names = [fake.last_name() for _ in range(name_pool_size)]
 
-    # Inserting data into Professors table
-    for _ in range(num_professors):
-        cursor.execute(
-            "INSERT INTO Professors (FirstName, LastName, Department, AcademicAchievement) VALUES (?, ?, ?, ?)",
-            (
-                fake.first_name(),
-                fake.last_name(),
-                random.choice(departments),
-                random.choice(academic_achievements),
-            ),
+    # Build every row up front so each table can be filled in bulk
+    professors = list(
+        zip(
+            rng.choices(first_names, k=num_professors),
+            rng.choices(last_names, k=num_professors),
+            rng.choices(departments, k=num_professors),
+            rng.choices(academic_achievements, k=num_professors),
         )
-
-    # Inserting data into Students table
-    for _ in range(num_students):
-        cursor.execute(
-            "INSERT INTO Students (FirstName, LastName, Age, DegreeProgram, CompletedCredits, GPA) VALUES (?, ?, ?, ?, ?, ?)",
-            (
-                fake.first_name(),
-                fake.last_name(),
-                random.randint(18, 25),
-                random.choice(degree_programs),
-                random.randint(0, 120),
-                round(random.uniform(2.0, 4.0), 2),
-            ),
+    )
+    # GPAs are drawn from the two-decimal values between 2.00 and 4.00
+    gpas = [points / 100 for points in range(200, 401)]
+    students = list(
+        zip(
+            rng.choices(first_names, k=num_students),
+            rng.choices(last_names, k=num_students),
+            rng.choices(range(18, 26), k=num_students),
+            rng.choices(degree_programs, k=num_students),
+            rng.choices(range(0, 121), k=num_students),
+            rng.choices(gpas, k=num_students),
         )
-
-    # Inserting data into Courses table
+    )
+    course_dates = []
     for _ in range(num_courses):
         start_date = fake.date_between(start_date="-2y", end_date="-1y")
         end_date = fake.date_between(start_date=start_date, end_date="today")
-        cursor.execute(
-            "INSERT INTO Courses (StartDate, EndDate, Name, CreditHours, ProfessorID) VALUES (?, ?, ?, ?, ?)",
+        course_dates.append((start_date.isoformat(), end_date.isoformat()))
+    courses = [
+        (start_date, end_date, name, credit_hours, professor_id)
+        for (start_date, end_date), name, credit_hours, professor_id in zip(
+            course_dates,
+            rng.choices(course_names, k=num_courses),
+            rng.choices(range(1, 5), k=num_courses),
+            rng.choices(range(1, num_professors + 1), k=num_courses),
+        )
+    ]
+    # For simplicity, each student is enrolled in 1 to 5 random courses
+    grades = ["A", "B", "C", "D", "F", "P", "NP"]
+    course_ids = range(1, num_courses + 1)
+    enrolled = [
+        (student_id, course_id)
+        for student_id, num_enrollments in zip(
+            range(1, num_students + 1), rng.choices(range(1, 6), k=num_students)
+        )
+        for course_id in rng.sample(course_ids, num_enrollments)
+    ]
+    enrollments = [
+        (student_id, course_id, grade)
+        for (student_id, course_id), grade in zip(
+            enrolled, rng.choices(grades, k=len(enrolled))
+        )
+    ]
+
+    # Seed the same database file the application opens, creating the
+    # tables first if it is new
+    db_path = get_db_path()
+    db_manager = DatabaseManager(db_path)
+    db_manager.initialize_database()
+    db_manager.close()
+
+    conn = sqlite3.connect(db_path)
+    cursor = conn.cursor()
+    # Seeding can simply be re-run if it fails, so skip the fsyncs and keep
+    # the database locked until it is done
+    cursor.execute("PRAGMA synchronous=OFF")
+    cursor.execute("PRAGMA locking_mode=EXCLUSIVE")
+
+    # All rows go in as a single transaction, so SQLite syncs to disk once
+    # at the end instead of at every commit. The secondary indexes are
+    # dropped for the inserts and built once at the end, rather than being
+    # updated row by row. The transaction is opened explicitly because
+    # sqlite3 would otherwise commit each DROP INDEX on its own, leaving the
+    # database without indexes if the inserts fail.
+    with conn:
+        cursor.execute("BEGIN")
+        for index_name in DatabaseManager.INDEX_DEFINITIONS:
+            cursor.execute(f"DROP INDEX IF EXISTS {index_name}")
+        bulk_insert(
+            cursor,
+            "Professors",
+            ("FirstName", "LastName", "Department", "AcademicAchievement"),
+            professors,
+        )
+        bulk_insert(
+            cursor,
+            "Students",
             (
-                start_date,
-                end_date,
-                random.choice(course_names),
-                random.randint(1, 4),
-                random.randint(1, num_professors),
+                "FirstName",
+                "LastName",
+                "Age",
+                "DegreeProgram",
+                "CompletedCredits",
+                "GPA",
             ),
+            students,
+        )
+        bulk_insert(
+            cursor,
+            "Courses",
+            ("StartDate", "EndDate", "Name", "CreditHours", "ProfessorID"),
+            courses,
+        )
+        bulk_insert(
+            cursor, "Enrollments", ("StudentID", "CourseID", "Grade"), enrollments
         )
+        for index_sql in DatabaseManager.INDEX_DEFINITIONS.values():
+            cursor.execute(index_sql)
 
-    # Commit the changes
-    conn.commit()
-
-    # Inserting data into Enrollments table
-    # For simplicity, each student is enrolled in a random number of courses
-    for student_id in range(1, num_students + 1):
-        num_enrollments = random.randint(1, 5)  # Each student enrolls in 1 to 5 courses
-        enrolled_courses = random.sample(range(1, num_courses + 1), num_enrollments)
-        for course_id in enrolled_courses:
-            grade = random.choice(["A", "B", "C", "D", "F", "P", "NP"])
-            cursor.execute(
-                "INSERT INTO Enrollments (StudentID, CourseID, Grade) VALUES (?, ?, ?)",
-                (student_id, course_id, grade),
-            )
-
-    # Commit the changes and close the connection
-    conn.commit()
     conn.close()
 
 
@@ -3,16 +3,19 @@
 This file contains the main application code for the EduMatrix application.
 """
 
-import csv
+import hmac
+import os
 import sys
+from typing import Iterable, List, Optional, Tuple
 
 import qdarkstyle
-from PyQt5.QtCore import QDate, Qt
+from PyQt5.QtCore import QDate, Qt, QThreadPool, QTimer
 from PyQt5.QtWidgets import (
     QApplication,
     QComboBox,
     QDateEdit,
     QDialog,
+    QDoubleSpinBox,
     QFileDialog,
     QHBoxLayout,
     QHeaderView,
@@ -20,10 +23,11 @@ from PyQt5.QtWidgets import (
     QLineEdit,
     QMainWindow,
     QMessageBox,
+    QProgressDialog,
     QPushButton,
+    QSpinBox,
     QSplitter,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
     QVBoxLayout,
     QWidget,
@@ -34,7 +38,30 @@ from edumatrix.controllers import (
     ProfessorController,
     StudentController,
 )
-from edumatrix.database import DatabaseManager
+from edumatrix.database import DatabaseManager, get_db_path
+from edumatrix.table_models import (
+    CourseStudentsModel,
+    CourseTableModel,
+    ProfessorCoursesModel,
+    ProfessorTableModel,
+    StudentCoursesModel,
+    StudentTableModel,
+)
+from edumatrix.workers import CsvExportWorker, QueryWorker
+
+# Delay after the last selection change before the detail tables are filled
+SELECTION_DEBOUNCE_MS = 150
+
+# Number of students around the selected one whose courses are loaded together
+STUDENT_COURSES_PREFETCH = 100
+
+# Number of courses around the selected one whose students are loaded together
+COURSE_STUDENTS_PREFETCH = 100
+
+# Threads running database queries and exports in the background. Each one
+# keeps its own SQLite connection, so the threads are kept alive rather than
+# expiring and leaving another connection behind every time one is replaced.
+DB_WORKER_THREADS = 2
 
 
 class LoginDialog(QDialog):
@@ -103,10 +130,10 @@ class LoginDialog(QDialog):
         Returns:
             None
         """
-        if (
-            self.username_input.text() == "admin"
-            and self.password_input.text() == "admin"
-        ):
+        # Compare in constant time; both checks always run
+        username_ok = hmac.compare_digest(self.username_input.text().encode(), b"admin")
+        password_ok = hmac.compare_digest(self.password_input.text().encode(), b"admin")
+        if username_ok & password_ok:
             self.accept()
         else:
             QMessageBox.warning(self, "Error", "Incorrect username or password.")
@@ -146,7 +173,12 @@ class EduMatrixApp(QMainWindow):
         self.professor_controller = professor_controller
         self.course_controller = course_controller
 
-        self.student_courses_table = QTableWidget()
+        self.worker_pool = QThreadPool(self)
+        self.worker_pool.setMaxThreadCount(DB_WORKER_THREADS)
+        self.worker_pool.setExpiryTimeout(-1)
+
+        self.student_courses_model = StudentCoursesModel()
+        self.student_courses_table = self.create_table_view(self.student_courses_model)
 
         self.currently_editing_student_id = None
 
@@ -156,13 +188,21 @@ class EduMatrixApp(QMainWindow):
         self.professor_department_input = QLineEdit()
         self.professor_achievement_input = QLineEdit()
 
+        # Values loaded into the number inputs by show_number
+        self._shown_numbers = {}
+
         # Input fields for student details
         self.student_first_name_input = QLineEdit()
         self.student_last_name_input = QLineEdit()
-        self.student_age_input = QLineEdit()
+        self.student_age_input = QSpinBox()
+        self.set_number_range(self.student_age_input, 1, 120)
         self.student_degree_input = QLineEdit()
-        self.student_credits_input = QLineEdit()
-        self.student_gpa_input = QLineEdit()
+        self.student_credits_input = QSpinBox()
+        self.set_number_range(self.student_credits_input, 0, 999)
+        self.student_gpa_input = QDoubleSpinBox()
+        self.student_gpa_input.setDecimals(2)
+        self.student_gpa_input.setSingleStep(0.1)
+        self.set_number_range(self.student_gpa_input, 0.0, 4.0)
 
         # Button to remove a student from a course
         self.remove_course_button = QPushButton("Remove from Course")
@@ -170,6 +210,39 @@ class EduMatrixApp(QMainWindow):
         # Dropdown for selecting a course to enroll
         self.enroll_course_dropdown = QComboBox()
 
+        # Courses listed in the dropdown; None until (re)loaded
+        self._courses_cache = None
+
+        # Courses of each student already looked up, keyed by student ID
+        self._student_courses_cache = {}
+        # Bumped whenever cached student courses are dropped, so that results
+        # of lookups started before then are not cached
+        self._student_courses_generation = 0
+
+        # Students of each course already looked up, keyed by course ID, and
+        # its generation counter, as for the student courses above
+        self._course_students_cache = {}
+        self._course_students_generation = 0
+
+        # Professor and course whose detail tables are currently filled, so
+        # repeated selection events for the same row are ignored
+        self._shown_professor_id = None
+        self._shown_course_id = None
+
+        # Selections waiting for their debounce timer, as (row, ID)
+        self._pending_student = None
+        self._pending_professor_id = None
+        self._pending_course = None
+        self._student_selection_timer = self.create_debounce_timer(
+            self.show_pending_student_courses
+        )
+        self._professor_selection_timer = self.create_debounce_timer(
+            self.show_pending_professor_courses
+        )
+        self._course_selection_timer = self.create_debounce_timer(
+            self.show_pending_course_students
+        )
+
         # Dropdown for selecting a start date
         self.course_start_date_dropdown = QComboBox()
 
@@ -177,29 +250,37 @@ class EduMatrixApp(QMainWindow):
         self.enroll_course_button = QPushButton("Enroll in Course")
 
         # Table for displaying professors
-        self.professors_table = QTableWidget()
+        self.professors_model = ProfessorTableModel()
+        self.professors_table = self.create_table_view(self.professors_model)
 
         # Second table for displaying courses taught by the selected professor
-        self.professor_courses_table = QTableWidget()
+        self.professor_courses_model = ProfessorCoursesModel()
+        self.professor_courses_table = self.create_table_view(
+            self.professor_courses_model
+        )
 
         self.currently_editing_professor_id = None
 
-        # Input fields for course details
+        # Input fields for course details; both dates start at today
+        today = QDate.currentDate()
         self.course_name_input = QLineEdit()
         self.course_start_date_input = QDateEdit()
         self.course_start_date_input.setCalendarPopup(True)
-        self.course_start_date_input.setDate(QDate.currentDate())
+        self.course_start_date_input.setDate(today)
         self.course_end_date_input = QDateEdit()
         self.course_end_date_input.setCalendarPopup(True)
-        self.course_end_date_input.setDate(QDate.currentDate())
-        self.course_credits_input = QLineEdit()
+        self.course_end_date_input.setDate(today)
+        self.course_credits_input = QSpinBox()
+        self.set_number_range(self.course_credits_input, 0, 99)
         self.course_professor_id_input = QLineEdit()
 
         # Table for displaying courses
-        self.courses_table = QTableWidget()
+        self.courses_model = CourseTableModel()
+        self.courses_table = self.create_table_view(self.courses_model)
 
         # Second table for displaying students enrolled in the selected course
-        self.course_students_table = QTableWidget()
+        self.course_students_model = CourseStudentsModel()
+        self.course_students_table = self.create_table_view(self.course_students_model)
 
         self.currently_editing_course_id = None
 
@@ -210,10 +291,105 @@ class EduMatrixApp(QMainWindow):
         self.setCentralWidget(self.tab_widget)
 
         # Initialize the students_table
-        self.students_table = QTableWidget()
+        self.students_model = StudentTableModel()
+        self.students_table = self.create_table_view(self.students_model)
 
         self.initialize_ui()
 
+    @staticmethod
+    def set_number_range(spin_box, minimum, maximum):
+        """
+        Sets the valid range of a spin box, plus a blank "Not set" value one
+        step below it.
+
+        Parameters
+        ----------
+        spin_box : QSpinBox or QDoubleSpinBox
+            The spin box to configure.
+        minimum : int or float
+            The smallest valid value.
+        maximum : int or float
+            The largest valid value.
+        """
+        spin_box.setRange(minimum - spin_box.singleStep(), maximum)
+        spin_box.setSpecialValueText("Not set")
+
+    def show_number(self, spin_box, value):
+        """
+        Shows a stored value in a spin box set up by set_number_range.
+
+        A NULL value, or one the spin box cannot hold, is shown as "Not set"
+        rather than being clamped into range. The value shown is remembered,
+        so that number_or_none can tell whether the user changed it.
+
+        Parameters
+        ----------
+        spin_box : QSpinBox or QDoubleSpinBox
+            The spin box to fill.
+        value : int, float or None
+            The stored value.
+        """
+        if value is None or not spin_box.minimum() < value <= spin_box.maximum():
+            value = spin_box.minimum()
+        spin_box.setValue(value)
+        self._shown_numbers[spin_box] = spin_box.value()
+
+    def clear_number(self, spin_box):
+        """
+        Resets a spin box set up by set_number_range to "Not set".
+
+        Parameters
+        ----------
+        spin_box : QSpinBox or QDoubleSpinBox
+            The spin box to clear.
+        """
+        spin_box.setValue(spin_box.minimum())
+        self._shown_numbers.pop(spin_box, None)
+
+    def number_or_none(self, spin_box):
+        """
+        Reads a spin box set up by set_number_range.
+
+        Parameters
+        ----------
+        spin_box : QSpinBox or QDoubleSpinBox
+            The spin box to read.
+
+        Returns
+        -------
+        int, float or None
+            The value, or None while the spin box shows "Not set" or still
+            shows the value loaded by show_number. An edit then leaves the
+            stored value as it is instead of writing back a rounded copy.
+        """
+        value = spin_box.value()
+        if value == spin_box.minimum() or value == self._shown_numbers.get(spin_box):
+            return None
+        return value
+
+    @staticmethod
+    def create_table_view(model):
+        """
+        Creates a read-only table view showing the given model.
+
+        Parameters
+        ----------
+        model : RecordTableModel
+            The model holding the table's records.
+
+        Returns
+        -------
+        QTableView
+            The table view.
+        """
+        view = QTableView()
+        view.setModel(model)
+        view.setSelectionBehavior(QTableView.SelectRows)
+        view.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+        # Every row keeps the default height, so rows are never measured
+        view.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+        return view
+
     def initialize_ui(self):
         """
         Initializes the user interface components.
@@ -223,10 +399,34 @@ class EduMatrixApp(QMainWindow):
         self.tab_widget.addTab(self.create_professors_tab(), "Professors")
         self.tab_widget.addTab(self.create_courses_tab(), "Courses")
 
-        # Update tables with existing data
+        # Fill the visible Students tab once the window has been drawn; the
+        # other tabs are filled the first time they are shown
+        QTimer.singleShot(0, self.load_students_tab)
+        self._tab_loaders = {
+            1: self.update_professors_table,
+            2: self.update_courses_table,
+        }
+        self.tab_widget.currentChanged.connect(self.on_tab_changed)
+
+    def load_students_tab(self):
+        """
+        Loads the students table and the enrollment dropdown from the database.
+        """
         self.update_students_table()
-        self.update_professors_table()
-        self.update_courses_table()
+        self.populate_courses_dropdown()
+
+    def on_tab_changed(self, index):
+        """
+        Fills a tab's table with data the first time the tab is shown.
+
+        Parameters
+        ----------
+        index : int
+            The index of the newly shown tab.
+        """
+        loader = self._tab_loaders.pop(index, None)
+        if loader is not None:
+            loader()
 
     def create_students_tab(self):
         """
@@ -255,14 +455,6 @@ class EduMatrixApp(QMainWindow):
         delete_button = QPushButton("Delete Student")
         delete_button.clicked.connect(self.delete_student)
 
-        # Table for displaying students
-        self.students_table = QTableWidget()
-        self.students_table.setColumnCount(7)  # Set the number of columns
-        self.students_table.setHorizontalHeaderLabels(
-            ["ID", "First Name", "Last Name", "Age", "Degree", "Credits", "GPA"]
-        )
-        self.students_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
         # Connect double-click event on the table to load_student_for_editing
         self.students_table.doubleClicked.connect(self.load_student_for_editing)
 
@@ -291,9 +483,6 @@ class EduMatrixApp(QMainWindow):
         self.remove_course_button.clicked.connect(self.remove_student_from_course)
         self.remove_course_button.setEnabled(False)  # Initially disabled
 
-        # Dropdown for selecting a course to enroll
-        self.populate_courses_dropdown()  # Populate with courses
-
         # Dropdown for selecting a start date
         self.course_start_date_dropdown.setEnabled(False)
 
@@ -322,31 +511,13 @@ class EduMatrixApp(QMainWindow):
         student_courses_layout.addWidget(student_courses_label)
         student_courses_layout.addWidget(self.student_courses_table)
 
-        # Second table for displaying courses for the selected student
-        self.student_courses_table.setColumnCount(
-            6
-        )  # For example, Course Name, Start Date, End Date
-        self.student_courses_table.setHorizontalHeaderLabels(
-            [
-                "Course ID",
-                "Course Name",
-                "Start Date",
-                "End Date",
-                "Credit Hours",
-                "Professor",
-            ]
-        )
-        self.student_courses_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.Stretch
-        )
-
         # Connect student_courses_table selection change signal
         self.student_courses_table.selectionModel().selectionChanged.connect(
             self.on_student_course_selected
         )
 
         # Connect row selection to update the courses table
-        self.students_table.selectionModel().selectionChanged.connect(
+        self.students_table.selectionModel().currentRowChanged.connect(
             self.on_student_selected
         )
         splitter.addWidget(self.students_table)
@@ -361,95 +532,35 @@ class EduMatrixApp(QMainWindow):
     def update_students_table(self):
         """
         Updates the students table with the latest data from the database.
-        """
-        # Fetch all students from the database
-        students = self.student_controller.list_all_students()
-
-        # Set the number of rows in the table
-        self.students_table.setRowCount(len(students))
 
-        # Populate the table with student data
-        for row, student in enumerate(students):
-            self.students_table.setItem(
-                row, 0, self.create_table_item(str(student.student_id))
-            )
-            self.students_table.setItem(
-                row, 1, self.create_table_item(student.first_name)
-            )
-            self.students_table.setItem(
-                row, 2, self.create_table_item(student.last_name)
-            )
-            self.students_table.setItem(
-                row, 3, self.create_table_item(str(student.age))
-            )
-            self.students_table.setItem(
-                row, 4, self.create_table_item(student.degree_program)
-            )
-            self.students_table.setItem(
-                row,
-                5,
-                self.create_table_item(str(student.completed_credits)),
-            )
-            self.students_table.setItem(
-                row, 6, self.create_table_item(str(student.gpa))
-            )
-
-    def create_table_item(self, text: str):
-        """
-        Creates a QTableWidgetItem with the specified text and editability.
-
-        Parameters
-        ----------
-        text : str
-            The text to be displayed in the table item.
-        editable : bool, optional
-            Whether the table item should be editable. Defaults to False.
-
-        Returns
-        -------
-        QTableWidgetItem
-            The created table item.
+        Students are read a page at a time as the table is scrolled.
         """
-        item = QTableWidgetItem(text)
-        item.setFlags(item.flags() ^ Qt.ItemIsEditable)  # Make the item read-only
-        return item
+        self.students_model.set_source(self.student_controller.list_students_after)
 
     def add_or_update_student(self):
         """
         Adds a new student record to the database and updates the table.
         """
-        # Collect data from input fields
-        first_name = self.student_first_name_input.text().strip()
-        last_name = self.student_last_name_input.text().strip()
-        try:
-            age = int(self.student_age_input.text().strip())
-            completed_credits = int(self.student_credits_input.text().strip())
-            gpa = float(self.student_gpa_input.text().strip())
-        except ValueError:
-            QMessageBox.warning(
-                self,
-                "Input Error",
-                "Please enter valid numbers for age, credits, and GPA.",
-            )
-            return
-
-        degree_program = self.student_degree_input.text().strip()
-
-        # Validate input data
-        if (
-            not all([first_name, last_name, degree_program])
-            or age <= 0
-            or completed_credits < 0
-            or not 0 <= gpa <= 4.0
-        ):
-            QMessageBox.warning(
-                self, "Input Error", "Please enter valid data for all fields."
-            )
+        # Collect and validate data from input fields
+        fields, error = self.student_controller.parse_student_fields(
+            self.student_first_name_input.text(),
+            self.student_last_name_input.text(),
+            self.number_or_none(self.student_age_input),
+            self.student_degree_input.text(),
+            self.number_or_none(self.student_credits_input),
+            self.number_or_none(self.student_gpa_input),
+        )
+        if not error and self.currently_editing_student_id is None and None in fields:
+            # Only an edit may leave a number unset, keeping its stored value
+            error = "Please enter valid data for all fields."
+        if error:
+            QMessageBox.warning(self, "Input Error", error)
             return
+        first_name, last_name, age, degree_program, completed_credits, gpa = fields
 
-        if hasattr(self, "currently_editing_student_id"):
+        if self.currently_editing_student_id is not None:
             # Update existing student
-            self.student_controller.update_student(
+            student = self.student_controller.update_student(
                 self.currently_editing_student_id,
                 first_name,
                 last_name,
@@ -458,98 +569,245 @@ class EduMatrixApp(QMainWindow):
                 completed_credits,
                 gpa,
             )
-            QMessageBox.information(self, "Success", "Student updated successfully.")
-            del self.currently_editing_student_id  # Clear the editing flag
+            if student is None:
+                # The student was deleted after being loaded for editing
+                self.students_model.remove_row(self.currently_editing_student_id)
+                self.invalidate_student_courses(self.currently_editing_student_id)
+                QMessageBox.warning(
+                    self, "Update Failed", "This student no longer exists."
+                )
+            else:
+                self.students_model.update_row(student)
+                QMessageBox.information(
+                    self, "Success", "Student updated successfully."
+                )
+            # Cached course rosters show the student's old name
+            self.invalidate_course_students()
+            self.currently_editing_student_id = None  # Clear the editing flag
         else:
             # Add new student
-            self.student_controller.add_student(
+            student_id = self.student_controller.add_student(
                 first_name, last_name, age, degree_program, completed_credits, gpa
             )
+            self.students_model.append_row(
+                self.student_controller.get_student(student_id)
+            )
             QMessageBox.information(self, "Success", "Student added successfully.")
 
-        # Update the students_table with new data and clear input fields
-        self.update_students_table()
         self.clear_student_input_fields()
 
     def export_students_to_csv(self):
         """
         Exports student data to a CSV file, allowing the user to specify the file name and location.
         """
-        # Fetch student data
-        students = self.student_controller.list_all_students()
+        filename = self.ask_csv_filename()
+        if filename:
+            # Write data to CSV in the background
+            self.start_csv_export(
+                filename,
+                [
+                    "Student ID",
+                    "First Name",
+                    "Last Name",
+                    "Age",
+                    "Degree Program",
+                    "Completed Credits",
+                    "GPA",
+                ],
+                (
+                    (
+                        student.student_id,
+                        student.first_name,
+                        student.last_name,
+                        student.age,
+                        student.degree_program,
+                        student.completed_credits,
+                        student.gpa,
+                    )
+                    for batch in self.student_controller.list_students_batched()
+                    for student in batch
+                ),
+                self.student_controller.count_students(),
+                "Student",
+            )
+
+    def ask_csv_filename(self) -> Optional[str]:
+        """
+        Asks the user where to save a CSV export.
 
-        # Open a file dialog to select the path and file name for the CSV
+        Returns
+        -------
+        Optional[str]
+            The chosen path, ending in .csv, or None if the dialog was cancelled.
+        """
         options = QFileDialog.Options()
         filename, _ = QFileDialog.getSaveFileName(
             self, "Save CSV File", "", "CSV Files (*.csv)", options=options
         )
+        if not filename:
+            return None
+        if not filename.endswith(".csv"):
+            filename += ".csv"  # Ensure the file has a .csv extension
+        return filename
 
-        # Check if a file name was selected
-        if filename:
-            if not filename.endswith(".csv"):
-                filename += ".csv"  # Ensure the file has a .csv extension
-
-            # Write data to CSV
-            with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-                # Write the header
-                writer.writerow(
-                    [
-                        "Student ID",
-                        "First Name",
-                        "Last Name",
-                        "Age",
-                        "Degree Program",
-                        "Completed Credits",
-                        "GPA",
-                    ]
-                )
-
-                # Write the student data
-                for student in students:
-                    writer.writerow(
-                        [
-                            student.student_id,
-                            student.first_name,
-                            student.last_name,
-                            student.age,
-                            student.degree_program,
-                            student.completed_credits,
-                            student.gpa,
-                        ]
-                    )
+    def confirm_delete_selected(
+        self, view: QTableView, record_type: str
+    ) -> Optional[int]:
+        """
+        Asks the user to confirm deleting the record selected in a table.
 
-            QMessageBox.information(
-                self,
-                "Export Successful",
-                f"Student data has been successfully exported to {filename}.",
-            )
+        Parameters
+        ----------
+        view : QTableView
+            The table holding the selection.
+        record_type : str
+            What the table lists, e.g. "student", for the messages.
 
-    def delete_student(self):
-        """
-        Deletes the selected student record from the database and updates the table.
+        Returns
+        -------
+        Optional[int]
+            The ID of the record to delete, or None if nothing was selected or
+            the user declined.
         """
-        selected_items = self.students_table.currentRow()
-        if not selected_items:
+        record_id = self.selected_record_id(view)
+        if record_id is None:
             QMessageBox.warning(
-                self, "Selection Error", "Please select a student to delete."
+                self, "Selection Error", f"Please select a {record_type} to delete."
             )
-            return
-
-        # Assuming the first column in the table contains the student ID
-        student_id = self.students_table.item(selected_items, 0).text()
+            return None
 
         # Confirm deletion
         reply = QMessageBox.question(
             self,
             "Confirm Deletion",
-            "Are you sure you want to delete this student?",
+            f"Are you sure you want to delete this {record_type}?",
             QMessageBox.Yes | QMessageBox.No,
             QMessageBox.No,
         )
-        if reply == QMessageBox.Yes:
+        return record_id if reply == QMessageBox.Yes else None
+
+    def start_csv_export(
+        self,
+        filename: str,
+        header: List[str],
+        rows: Iterable[Tuple],
+        total: int,
+        record_type: str,
+    ):
+        """
+        Writes rows to a CSV file on a worker thread, showing its progress.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the CSV file to write.
+        header : List[str]
+            The header row.
+        rows : Iterable[Tuple]
+            The data rows, consumed on the worker thread.
+        total : int
+            The number of rows, used as the progress maximum.
+        record_type : str
+            What is being exported, e.g. "Student", for the messages.
+        """
+        progress = QProgressDialog(self)
+        progress.setWindowTitle("Exporting")
+        progress.setLabelText("Exporting to CSV...")
+        progress.setCancelButton(None)
+        progress.setRange(0, total)
+
+        def on_finished(path):
+            progress.close()
+            QMessageBox.information(
+                self,
+                "Export Successful",
+                f"{record_type} data has been successfully exported to {path}.",
+            )
+
+        def on_error(message):
+            progress.close()
+            QMessageBox.warning(self, "Export Failed", message)
+
+        worker = CsvExportWorker(filename, header, rows)
+        worker.signals.progress.connect(progress.setValue)
+        worker.signals.finished.connect(on_finished)
+        worker.signals.error.connect(on_error)
+        self.worker_pool.start(worker)
+
+    def create_debounce_timer(self, callback) -> QTimer:
+        """
+        Creates a single-shot timer that runs a callback SELECTION_DEBOUNCE_MS
+        after it was last (re)started.
+
+        Parameters
+        ----------
+        callback : callable
+            Called when the timer fires.
+
+        Returns
+        -------
+        QTimer
+            The timer, owned by the main window.
+        """
+        timer = QTimer(self)
+        timer.setSingleShot(True)
+        timer.setInterval(SELECTION_DEBOUNCE_MS)
+        timer.timeout.connect(callback)
+        return timer
+
+    @staticmethod
+    def record_ids_around(model, row: int, count: int) -> List[int]:
+        """
+        Returns the IDs of up to count loaded records centred on a row.
+
+        Parameters
+        ----------
+        model : RecordTableModel
+            The model holding the records.
+        row : int
+            The row to centre on.
+        count : int
+            The maximum number of IDs to return.
+
+        Returns
+        -------
+        List[int]
+            The record IDs, in row order.
+        """
+        start = max(0, row - count // 2)
+        end = min(model.rowCount(), start + count)
+        return [model.index(index, 0).data(Qt.UserRole) for index in range(start, end)]
+
+    @staticmethod
+    def selected_record_id(view: QTableView) -> Optional[int]:
+        """
+        Returns the ID of the record at the view's current row.
+
+        Parameters
+        ----------
+        view : QTableView
+            A students, professors or courses table.
+
+        Returns
+        -------
+        Optional[int]
+            The record's ID, or None if no row is selected.
+        """
+        return view.currentIndex().data(Qt.UserRole)
+
+    def delete_student(self):
+        """
+        Deletes the selected student record from the database and updates the table.
+        """
+        student_id = self.confirm_delete_selected(self.students_table, "student")
+        if student_id is not None:
             self.student_controller.delete_student(student_id)
-            self.update_students_table()
+            self.students_model.remove_row(student_id)
+            if student_id == self.currently_editing_student_id:
+                self.currently_editing_student_id = None
+                self.clear_student_input_fields()
+            self.invalidate_student_courses(student_id)
+            self.invalidate_course_students()
             QMessageBox.information(self, "Success", "Student deleted successfully.")
 
     def clear_student_input_fields(self):
@@ -558,10 +816,10 @@ class EduMatrixApp(QMainWindow):
         """
         self.student_first_name_input.clear()
         self.student_last_name_input.clear()
-        self.student_age_input.clear()
+        self.clear_number(self.student_age_input)
         self.student_degree_input.clear()
-        self.student_credits_input.clear()
-        self.student_gpa_input.clear()
+        self.clear_number(self.student_credits_input)
+        self.clear_number(self.student_gpa_input)
 
     def load_student_for_editing(self, index):
         """
@@ -572,34 +830,116 @@ class EduMatrixApp(QMainWindow):
         index : QModelIndex
             The index of the selected item in the table.
         """
-        # Fetch the student ID from the table
-        student_id = self.students_table.item(index.row(), 0).text()
-        # Assuming student ID is in the first column
-        self.currently_editing_student_id = int(student_id)
+        # The model already holds the student, so no database read is needed
+        student = self.students_model.row_at(index.row())
+        self.currently_editing_student_id = student.student_id
 
         # Load the student data into the input fields
-        student = self.student_controller.get_student(self.currently_editing_student_id)
-        if student:
-            self.student_first_name_input.setText(student.first_name)
-            self.student_last_name_input.setText(student.last_name)
-            self.student_age_input.setText(str(student.age))
-            self.student_degree_input.setText(student.degree_program)
-            self.student_credits_input.setText(str(student.completed_credits))
-            self.student_gpa_input.setText(str(student.gpa))
+        self.student_first_name_input.setText(student.first_name)
+        self.student_last_name_input.setText(student.last_name)
+        self.show_number(self.student_age_input, student.age)
+        self.student_degree_input.setText(student.degree_program)
+        self.show_number(self.student_credits_input, student.completed_credits)
+        self.show_number(self.student_gpa_input, student.gpa)
 
-    def on_student_selected(self, selected):
+    def on_student_selected(self, current, previous):
         """
         Handle the event when a student is selected in the table.
 
         Args:
-            selected: The selected item(s) in the table.
+            current: The index of the newly current row.
+            previous: The index of the previously current row.
+        """
+        if current.isValid():
+            selected_row = current.row()
+            self._pending_student = (
+                selected_row,
+                self.students_model.row_at(selected_row).student_id,
+            )
+            # Only the last of a burst of selection changes fills the table
+            self._student_selection_timer.start()
+
+    def show_pending_student_courses(self):
         """
-        if selected.indexes():
-            selected_row = selected.indexes()[0].row()
-            student_id = self.students_table.item(
-                selected_row, 0
-            ).text()  # Assuming student ID is in the first column
-            self.populate_student_courses(int(student_id))
+        Fills the student_courses_table for the last selected student.
+        """
+        if self._pending_student is None:
+            return
+        selected_row, student_id = self._pending_student
+        if student_id in self._student_courses_cache:
+            self.populate_student_courses(student_id)
+        else:
+            self.prefetch_student_courses(selected_row)
+
+    def prefetch_student_courses(self, row: int):
+        """
+        Loads the courses of the students around a table row in one query, so
+        that moving through the table is served from memory.
+
+        The query runs on the thread pool; on_student_courses_fetched fills
+        the table once it returns.
+
+        Parameters
+        ----------
+        row : int
+            The row of the students table to load around.
+        """
+        student_ids = [
+            student_id
+            for student_id in self.record_ids_around(
+                self.students_model, row, STUDENT_COURSES_PREFETCH
+            )
+            if student_id not in self._student_courses_cache
+        ]
+        if not student_ids:
+            return
+
+        generation = self._student_courses_generation
+        worker = QueryWorker(
+            self.course_controller.get_courses_for_students, student_ids
+        )
+        worker.signals.result.connect(
+            lambda courses: self.on_student_courses_fetched(courses, generation)
+        )
+        worker.signals.error.connect(
+            lambda message: QMessageBox.warning(self, "Database Error", message)
+        )
+        self.worker_pool.start(worker)
+
+    def on_student_courses_fetched(self, courses, generation: int):
+        """
+        Caches the result of a background student courses lookup and shows
+        the selected student's courses if they are among them.
+
+        Parameters
+        ----------
+        courses : Dict[int, list]
+            Student IDs mapped to their courses.
+        generation : int
+            The cache generation the lookup was started in.
+        """
+        if generation != self._student_courses_generation:
+            # Enrollments or courses changed while the query ran
+            self.show_pending_student_courses()
+            return
+        self._student_courses_cache.update(courses)
+        if self._pending_student is not None and self._pending_student[1] in courses:
+            self.populate_student_courses(self._pending_student[1])
+
+    def invalidate_student_courses(self, student_id: Optional[int] = None):
+        """
+        Drops cached student courses after enrollments or courses change.
+
+        Parameters
+        ----------
+        student_id : int, optional
+            The student whose courses changed. Drops every student if omitted.
+        """
+        if student_id is None:
+            self._student_courses_cache.clear()
+        else:
+            self._student_courses_cache.pop(student_id, None)
+        self._student_courses_generation += 1
 
     def populate_student_courses(self, student_id):
         """
@@ -610,50 +950,42 @@ class EduMatrixApp(QMainWindow):
         student_id : int
             The ID of the selected student.
         """
-        courses = self.course_controller.get_courses_for_student(student_id)
-
-        self.student_courses_table.setColumnCount(6)  # Adjust the column count
-        self.student_courses_table.setHorizontalHeaderLabels(
-            [
-                "Course ID",
-                "Course Name",
-                "Start Date",
-                "End Date",
-                "Credit Hours",
-                "Professor",
-            ]
-        )
-
-        self.student_courses_table.setRowCount(len(courses))
-
-        for row, course in enumerate(courses):
-            self.student_courses_table.setItem(
-                row, 0, self.create_table_item(str(course[0]))
-            )  # Course ID
-            self.student_courses_table.setItem(
-                row, 1, self.create_table_item(course[1])
-            )  # Course Name
-            self.student_courses_table.setItem(
-                row, 2, self.create_table_item(course[2])
-            )  # Start Date
-            self.student_courses_table.setItem(
-                row, 3, self.create_table_item(course[3])
-            )  # End Date
-            self.student_courses_table.setItem(
-                row, 4, self.create_table_item(str(course[4]))
-            )  # Credit Hours
-            self.student_courses_table.setItem(
-                row, 5, self.create_table_item(course[5])
-            )  # Professor Name
+        courses = self._student_courses_cache.get(student_id)
+        if courses is None:
+            courses = self.course_controller.get_courses_for_student(student_id)
+            self._student_courses_cache[student_id] = courses
+        self.student_courses_model.set_rows(courses)
 
     def populate_courses_dropdown(self):
         """
         Populates the enroll_course_dropdown with all available courses.
+
+        The course list is cached and only fetched again after a course is
+        added, updated or deleted.
+        """
+        if self._courses_cache is None:
+            self._courses_cache = self.course_controller.list_all_courses()
+
+        # Fill the dropdown in one batch without a signal per item
+        self.enroll_course_dropdown.blockSignals(True)
+        self.enroll_course_dropdown.clear()
+        self.enroll_course_dropdown.addItems(
+            [course.name for course in self._courses_cache]
+        )
+        for index, course in enumerate(self._courses_cache):
+            self.enroll_course_dropdown.setItemData(index, course.course_id)
+        self.enroll_course_dropdown.blockSignals(False)
+        self.on_course_selection_changed(self.enroll_course_dropdown.currentIndex())
+
+    def refresh_courses_dropdown(self):
         """
-        # Fetch all courses and add to the dropdown
-        courses = self.course_controller.list_all_courses()
-        for course in courses:
-            self.enroll_course_dropdown.addItem(course.name, course.course_id)
+        Reloads the enroll_course_dropdown after the courses have changed.
+        """
+        self._courses_cache = None
+        # A professor's or a student's course list may have changed too
+        self._shown_professor_id = None
+        self.invalidate_student_courses()
+        self.populate_courses_dropdown()
 
     def on_course_selection_changed(self, index):
         """
@@ -672,37 +1004,39 @@ class EduMatrixApp(QMainWindow):
         """
         Enrolls the selected student in the chosen course.
         """
-        selected_student_row = self.students_table.currentRow()
-        if selected_student_row < 0:
+        student_id = self.selected_record_id(self.students_table)
+        if student_id is None:
             QMessageBox.warning(self, "Selection Error", "Please select a student.")
             return
-        student_id = self.students_table.item(selected_student_row, 0).text()
 
         course_id = self.enroll_course_dropdown.currentData()
-        self.student_controller.enroll_student_in_course(
-            int(student_id), int(course_id)
-        )
-        self.populate_student_courses(int(student_id))
+        if not self.student_controller.enroll_student_in_course(
+            student_id, int(course_id)
+        ):
+            QMessageBox.information(
+                self, "Already Enrolled", "The student is already in this course."
+            )
+            return
+        self.invalidate_student_courses(student_id)
+        self.invalidate_course_students(course_id)
+        self.populate_student_courses(student_id)
 
     def remove_student_from_course(self):
         """
         Removes the selected student from the selected course.
         """
-        selected_student_row = self.students_table.currentRow()
-        selected_course_row = self.student_courses_table.currentRow()
-        if selected_student_row < 0 or selected_course_row < 0:
+        student_id = self.selected_record_id(self.students_table)
+        selected_course_row = self.student_courses_table.currentIndex().row()
+        if student_id is None or selected_course_row < 0:
             QMessageBox.warning(
                 self, "Selection Error", "Please select a student and a course."
             )
             return
-        student_id = self.students_table.item(selected_student_row, 0).text()
-        course_id = self.student_courses_table.item(
-            selected_course_row, 0
-        ).text()  # Assuming course ID is stored
-        self.student_controller.remove_student_from_course(
-            int(student_id), int(course_id)
-        )
-        self.populate_student_courses(int(student_id))
+        course_id = self.student_courses_model.row_at(selected_course_row)["CourseID"]
+        self.student_controller.remove_student_from_course(student_id, course_id)
+        self.invalidate_student_courses(student_id)
+        self.invalidate_course_students(course_id)
+        self.populate_student_courses(student_id)
 
     def on_student_course_selected(self, selected):
         """
@@ -738,20 +1072,10 @@ class EduMatrixApp(QMainWindow):
         export_csv_button = QPushButton("Export to CSV")
         export_csv_button.clicked.connect(self.export_professors_to_csv)
 
-        # Table for displaying professors
-        self.professors_table.setColumnCount(5)  # Number of fields
-        self.professors_table.setHorizontalHeaderLabels(
-            ["ID", "First Name", "Last Name", "Department", "Achievement"]
-        )
-
-        self.professors_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.Stretch
-        )
-
         self.professors_table.doubleClicked.connect(self.load_professor_for_editing)
 
         # Connect row selection to update the courses table
-        self.professors_table.selectionModel().selectionChanged.connect(
+        self.professors_table.selectionModel().currentRowChanged.connect(
             self.on_professor_selected
         )
 
@@ -779,18 +1103,6 @@ class EduMatrixApp(QMainWindow):
         professor_courses_layout.addWidget(professor_courses_label)
         professor_courses_layout.addWidget(self.professor_courses_table)
 
-        # Second table for displaying courses taught by the selected professor
-        self.professor_courses_table.setColumnCount(
-            4
-        )  # Example: Course Name, Start Date, End Date, Credit Hours
-        self.professor_courses_table.setHorizontalHeaderLabels(
-            ["Course Name", "Start Date", "End Date", "Credit Hours"]
-        )
-
-        self.professor_courses_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.Stretch
-        )
-
         splitter.addWidget(self.professors_table)
         splitter.addWidget(professor_courses_container)
 
@@ -804,146 +1116,111 @@ class EduMatrixApp(QMainWindow):
         """
         Updates the professors table with the latest data from the database.
         """
-        professors = self.professor_controller.list_all_professors()
-
-        self.professors_table.setRowCount(len(professors))
-
-        for row, professor in enumerate(professors):
-            self.professors_table.setItem(
-                row,
-                0,
-                self.create_table_item(str(professor.professor_id)),
-            )
-            self.professors_table.setItem(
-                row, 1, self.create_table_item(professor.first_name)
-            )
-            self.professors_table.setItem(
-                row, 2, self.create_table_item(professor.last_name)
-            )
-            self.professors_table.setItem(
-                row, 3, self.create_table_item(professor.department)
-            )
-            self.professors_table.setItem(
-                row,
-                4,
-                self.create_table_item(professor.academic_achievement),
-            )
+        self.professors_model.set_rows(self.professor_controller.list_all_professors())
 
     def add_or_update_professor(self):
         """
         Adds a new professor or updates an existing one based on the input fields.
         """
-        # Collect data from input fields
-        first_name = self.professor_first_name_input.text().strip()
-        last_name = self.professor_last_name_input.text().strip()
-        department = self.professor_department_input.text().strip()
-        academic_achievement = self.professor_achievement_input.text().strip()
-
-        # Validate input data
-        if not all([first_name, last_name, department, academic_achievement]):
-            QMessageBox.warning(
-                self, "Input Error", "Please enter valid data for all fields."
-            )
+        # Collect and validate data from input fields
+        fields, error = self.professor_controller.parse_professor_fields(
+            self.professor_first_name_input.text(),
+            self.professor_last_name_input.text(),
+            self.professor_department_input.text(),
+            self.professor_achievement_input.text(),
+        )
+        if error:
+            QMessageBox.warning(self, "Input Error", error)
             return
+        first_name, last_name, department, academic_achievement = fields
 
-        if hasattr(self, "currently_editing_professor_id"):
+        if self.currently_editing_professor_id is not None:
             # Update existing professor
-            self.professor_controller.update_professor(
+            professor = self.professor_controller.update_professor(
                 self.currently_editing_professor_id,
                 first_name,
                 last_name,
                 department,
                 academic_achievement,
             )
-            QMessageBox.information(self, "Success", "Professor updated successfully.")
-            del self.currently_editing_professor_id  # Clear the editing flag
+            if professor is None:
+                # The professor was deleted after being loaded for editing
+                self.professors_model.remove_row(self.currently_editing_professor_id)
+                QMessageBox.warning(
+                    self, "Update Failed", "This professor no longer exists."
+                )
+            else:
+                self.professors_model.update_row(professor)
+                QMessageBox.information(
+                    self, "Success", "Professor updated successfully."
+                )
+            self.refresh_courses_for_professor(self.currently_editing_professor_id)
+            # Cached student courses show the professor's old name
+            self.invalidate_student_courses()
+            self.currently_editing_professor_id = None  # Clear the editing flag
         else:
             # Add new professor
-            self.professor_controller.add_professor(
+            professor_id = self.professor_controller.add_professor(
                 first_name, last_name, department, academic_achievement
             )
+            self.professors_model.append_row(
+                self.professor_controller.get_professor(professor_id)
+            )
             QMessageBox.information(self, "Success", "Professor added successfully.")
 
-        # Update the professors_table with new data and clear input fields
-        self.update_professors_table()
         self.clear_professor_input_fields()
 
+    def refresh_courses_for_professor(self, professor_id: int):
+        """
+        Updates the rows of the courses table taught by a given professor, so
+        they show the professor's current name.
+
+        Parameters
+        ----------
+        professor_id : int
+        """
+        for row in range(self.courses_model.rowCount()):
+            course = self.courses_model.row_at(row)
+            if course.professor_id == professor_id:
+                self.courses_model.update_row(
+                    self.course_controller.get_course(course.course_id)
+                )
+
     def export_professors_to_csv(self):
         """
         Exports professor data to a CSV file, allowing the user to specify
         the file name and location.
         """
-        # Fetch professor data
-        professors = self.professor_controller.list_all_professors()
-
-        # Open a file dialog to select the path and file name for the CSV
-        options = QFileDialog.Options()
-        filename, _ = QFileDialog.getSaveFileName(
-            self, "Save CSV File", "", "CSV Files (*.csv)", options=options
-        )
-
-        # Check if a file name was selected
+        filename = self.ask_csv_filename()
         if filename:
-            if not filename.endswith(".csv"):
-                filename += ".csv"  # Ensure the file has a .csv extension
-
-            # Write data to CSV
-            with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-                # Write the header
-                writer.writerow(
-                    [
-                        "Professor ID",
-                        "First Name",
-                        "Last Name",
-                        "Department",
-                        "Achievement",
-                    ]
-                )
-
-                # Write the professor data
-                for professor in professors:
-                    writer.writerow(
-                        [
-                            professor.professor_id,
-                            professor.first_name,
-                            professor.last_name,
-                            professor.department,
-                            professor.academic_achievement,
-                        ]
-                    )
-
-            QMessageBox.information(
-                self,
-                "Export Successful",
-                f"Professor data has been successfully exported to {filename}.",
+            # Write data to CSV in the background
+            self.start_csv_export(
+                filename,
+                [
+                    "Professor ID",
+                    "First Name",
+                    "Last Name",
+                    "Department",
+                    "Achievement",
+                ],
+                self.professor_controller.iter_professor_rows(),
+                self.professor_controller.count_professors(),
+                "Professor",
             )
 
     def delete_professor(self):
         """
         Deletes the selected professor record from the database and updates the table.
         """
-        selected_items = self.professors_table.currentRow()
-        if not selected_items:
-            QMessageBox.warning(
-                self, "Selection Error", "Please select a professor to delete."
-            )
-            return
-
-        # Assuming the first column in the table contains the professor ID
-        professor_id = int(self.professors_table.item(selected_items, 0).text())
-
-        # Confirm deletion
-        reply = QMessageBox.question(
-            self,
-            "Confirm Deletion",
-            "Are you sure you want to delete this professor?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No,
-        )
-        if reply == QMessageBox.Yes:
+        professor_id = self.confirm_delete_selected(self.professors_table, "professor")
+        if professor_id is not None:
             self.professor_controller.delete_professor(professor_id)
-            self.update_professors_table()
+            self.professors_model.remove_row(professor_id)
+            if professor_id == self.currently_editing_professor_id:
+                self.currently_editing_professor_id = None
+                self.clear_professor_input_fields()
+            self.refresh_courses_for_professor(professor_id)
+            self.invalidate_student_courses()
             QMessageBox.information(self, "Success", "Professor deleted successfully.")
 
     def clear_professor_input_fields(self):
@@ -964,36 +1241,43 @@ class EduMatrixApp(QMainWindow):
         index : QModelIndex
             The index of the selected item in the table.
         """
-        professor_id = self.professors_table.item(
-            index.row(), 0
-        ).text()  # Assuming professor ID is in the first column
-        self.currently_editing_professor_id = int(professor_id)
+        # The model already holds the professor, so no database read is needed
+        professor = self.professors_model.row_at(index.row())
+        self.currently_editing_professor_id = professor.professor_id
 
-        professor = self.professor_controller.get_professor(
-            self.currently_editing_professor_id
-        )
-        if professor:
-            self.professor_first_name_input.setText(professor.first_name)
-            self.professor_last_name_input.setText(professor.last_name)
-            self.professor_department_input.setText(professor.department)
-            self.professor_achievement_input.setText(professor.academic_achievement)
+        self.professor_first_name_input.setText(professor.first_name)
+        self.professor_last_name_input.setText(professor.last_name)
+        self.professor_department_input.setText(professor.department)
+        self.professor_achievement_input.setText(professor.academic_achievement)
 
-    def on_professor_selected(self, selected):
+    def on_professor_selected(self, current, previous):
         """
         Handle the event when a professor is selected in the UI.
 
         Args:
-            selected: The selected item in the UI.
+            current: The index of the newly current row.
+            previous: The index of the previously current row.
 
         Returns:
             None
         """
-        if selected.indexes():
-            selected_row = selected.indexes()[0].row()
-            professor_id = self.professors_table.item(
-                selected_row, 0
-            ).text()  # Assuming professor ID is in the first column
-            self.populate_professor_courses(int(professor_id))
+        if current.isValid():
+            selected_row = current.row()
+            self._pending_professor_id = self.professors_model.row_at(
+                selected_row
+            ).professor_id
+            # Only the last of a burst of selection changes fills the table
+            self._professor_selection_timer.start()
+
+    def show_pending_professor_courses(self):
+        """
+        Fills the professor_courses_table for the last selected professor.
+        """
+        professor_id = self._pending_professor_id
+        if professor_id is None or professor_id == self._shown_professor_id:
+            return
+        self.populate_professor_courses(professor_id)
+        self._shown_professor_id = professor_id
 
     def populate_professor_courses(self, professor_id):
         """
@@ -1004,24 +1288,9 @@ class EduMatrixApp(QMainWindow):
         professor_id : int
             The ID of the selected professor.
         """
-        courses = self.course_controller.get_courses_for_professor(professor_id)
-
-        self.professor_courses_table.setRowCount(len(courses))
-
-        for row, course in enumerate(courses):
-            # Assuming course data is a tuple like (course_name, start_date, end_date, credit_hours)
-            self.professor_courses_table.setItem(
-                row, 0, self.create_table_item(course[0])
-            )  # Course Name
-            self.professor_courses_table.setItem(
-                row, 1, self.create_table_item(course[1])
-            )  # Start Date
-            self.professor_courses_table.setItem(
-                row, 2, self.create_table_item(course[2])
-            )  # End Date
-            self.professor_courses_table.setItem(
-                row, 3, self.create_table_item(str(course[3]))
-            )  # Credit Hours
+        self.professor_courses_model.set_rows(
+            self.course_controller.get_courses_for_professor(professor_id)
+        )
 
     def create_courses_tab(self):
         """
@@ -1048,26 +1317,10 @@ class EduMatrixApp(QMainWindow):
         export_csv_button = QPushButton("Export to CSV")
         export_csv_button.clicked.connect(self.export_courses_to_csv)
 
-        # Table for displaying courses
-        self.courses_table.setColumnCount(7)  # Number of fields
-        self.courses_table.setHorizontalHeaderLabels(
-            [
-                "ID",
-                "Name",
-                "Start Date",
-                "End Date",
-                "Credits",
-                "Professor ID",
-                "Professor Name",
-            ]
-        )
-
-        self.courses_table.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-
         self.courses_table.doubleClicked.connect(self.load_course_for_editing)
 
         # Connect row selection to update the students table
-        self.courses_table.selectionModel().selectionChanged.connect(
+        self.courses_table.selectionModel().currentRowChanged.connect(
             self.on_course_selected
         )
 
@@ -1097,18 +1350,6 @@ class EduMatrixApp(QMainWindow):
         course_students_layout.addWidget(course_students_label)
         course_students_layout.addWidget(self.course_students_table)
 
-        # Second table for displaying students enrolled in the selected course
-        self.course_students_table.setColumnCount(
-            3
-        )  # Example: Student ID, First Name, Last Name
-        self.course_students_table.setHorizontalHeaderLabels(
-            ["Student ID", "First Name", "Last Name"]
-        )
-
-        self.course_students_table.horizontalHeader().setSectionResizeMode(
-            QHeaderView.Stretch
-        )
-
         splitter.addWidget(self.courses_table)
         splitter.addWidget(course_students_container)
 
@@ -1121,64 +1362,34 @@ class EduMatrixApp(QMainWindow):
     def update_courses_table(self):
         """
         Updates the courses table with the latest data from the database.
+
+        Courses are read a page at a time as the table is scrolled.
         """
-        courses = self.course_controller.list_all_courses()
-
-        self.courses_table.setRowCount(len(courses))
-
-        for row, course in enumerate(courses):
-            self.courses_table.setItem(
-                row, 0, self.create_table_item(str(course.course_id))
-            )  # Course ID
-            self.courses_table.setItem(
-                row, 1, self.create_table_item(course.name)
-            )  # Course Name
-            self.courses_table.setItem(
-                row, 2, self.create_table_item(course.start_date)
-            )  # Start Date
-            self.courses_table.setItem(
-                row, 3, self.create_table_item(course.end_date)
-            )  # End Date
-            self.courses_table.setItem(
-                row, 4, self.create_table_item(str(course.credit_hours))
-            )  # Credit Hours
-            self.courses_table.setItem(
-                row, 5, self.create_table_item(str(course.professor_id))
-            )  # Professor Name
-            self.courses_table.setItem(
-                row, 6, self.create_table_item(course.professor_name)
-            )  # Professor Name
+        self.courses_model.set_source(self.course_controller.list_courses_after)
 
     def add_or_update_course(self):
         """
         Adds a new course or updates an existing one based on the input fields.
         """
-        # Collect data from input fields
-        name = self.course_name_input.text().strip()
-        start_date = self.course_start_date_input.date().toString("yyyy-MM-dd")
-        end_date = self.course_end_date_input.date().toString("yyyy-MM-dd")
-        course_credits = self.course_credits_input.text().strip()
-        professor_id = self.course_professor_id_input.text().strip()
-
-        # Validate input data
-        if not all([name, start_date, end_date, course_credits, professor_id]):
-            QMessageBox.warning(
-                self, "Input Error", "Please enter valid data for all fields."
-            )
-            return
-
-        try:
-            course_credits = int(course_credits)
-            professor_id = int(professor_id)
-        except ValueError:
-            QMessageBox.warning(
-                self, "Input Error", "Credits and Professor ID must be numbers."
-            )
+        # Collect and validate data from input fields
+        fields, error = self.course_controller.parse_course_fields(
+            self.course_name_input.text(),
+            self.course_start_date_input.date().toString(Qt.ISODate),
+            self.course_end_date_input.date().toString(Qt.ISODate),
+            self.number_or_none(self.course_credits_input),
+            self.course_professor_id_input.text(),
+        )
+        if not error and self.currently_editing_course_id is None and None in fields:
+            # Only an edit may leave the credits unset, keeping their stored value
+            error = "Please enter valid data for all fields."
+        if error:
+            QMessageBox.warning(self, "Input Error", error)
             return
+        name, start_date, end_date, course_credits, professor_id = fields
 
-        if hasattr(self, "currently_editing_course_id"):
+        if self.currently_editing_course_id is not None:
             # Update existing course
-            self.course_controller.update_course(
+            course = self.course_controller.update_course(
                 self.currently_editing_course_id,
                 start_date,
                 end_date,
@@ -1186,96 +1397,79 @@ class EduMatrixApp(QMainWindow):
                 course_credits,
                 professor_id,
             )
-            QMessageBox.information(self, "Success", "Course updated successfully.")
-            del self.currently_editing_course_id  # Clear the editing flag
+            if course is None:
+                # The course was deleted after being loaded for editing
+                self.courses_model.remove_row(self.currently_editing_course_id)
+                self.invalidate_course_students(self.currently_editing_course_id)
+                QMessageBox.warning(
+                    self, "Update Failed", "This course no longer exists."
+                )
+            else:
+                self.courses_model.update_row(course)
+                QMessageBox.information(self, "Success", "Course updated successfully.")
+            self.currently_editing_course_id = None  # Clear the editing flag
         else:
             # Add new course
-            self.course_controller.add_course(
+            course_id = self.course_controller.add_course(
                 start_date, end_date, name, course_credits, professor_id
             )
+            self.courses_model.append_row(self.course_controller.get_course(course_id))
             QMessageBox.information(self, "Success", "Course added successfully.")
 
-        # Update the courses_table with new data and clear input fields
-        self.update_courses_table()
+        self.refresh_courses_dropdown()
         self.clear_course_input_fields()
 
     def export_courses_to_csv(self):
         """
         Exports course data to a CSV file, allowing the user to specify the file name and location.
         """
-        # Fetch course data
-        courses = self.course_controller.list_all_courses()
-
-        # Open a file dialog to select the path and file name for the CSV
-        options = QFileDialog.Options()
-        filename, _ = QFileDialog.getSaveFileName(
-            self, "Save CSV File", "", "CSV Files (*.csv)", options=options
-        )
-
-        # Check if a file name was selected
+        filename = self.ask_csv_filename()
         if filename:
-            if not filename.endswith(".csv"):
-                filename += ".csv"  # Ensure the file has a .csv extension
-
-            # Write data to CSV
-            with open(filename, "w", newline="", encoding="utf-8") as csvfile:
-                writer = csv.writer(csvfile)
-                # Write the header
-                writer.writerow(
-                    [
-                        "Course ID",
-                        "Name",
-                        "Start Date",
-                        "End Date",
-                        "Credit Hours",
-                        "Professor Name",
-                    ]
-                )
-
-                # Write the course data
-                for course in courses:
-                    writer.writerow(
-                        [
-                            course.course_id,
-                            course.name,
-                            course.start_date,
-                            course.end_date,
-                            course.credit_hours,
-                            course.professor_name,
-                        ]
+            # Write data to CSV in the background
+            self.start_csv_export(
+                filename,
+                [
+                    "Course ID",
+                    "Name",
+                    "Start Date",
+                    "End Date",
+                    "Credit Hours",
+                    "Professor Name",
+                ],
+                (
+                    (
+                        course.course_id,
+                        course.name,
+                        course.start_date,
+                        course.end_date,
+                        course.credit_hours,
+                        course.professor_name,
                     )
-
-            QMessageBox.information(
-                self,
-                "Export Successful",
-                f"Course data has been successfully exported to {filename}.",
+                    for course in self.course_controller.iter_all_courses()
+                ),
+                self.course_controller.count_courses(),
+                "Course",
             )
 
     def delete_course(self):
         """
         Deletes the selected course record from the database and updates the table.
         """
-        selected_items = self.courses_table.currentRow()
-        if not selected_items:
-            QMessageBox.warning(
-                self, "Selection Error", "Please select a course to delete."
-            )
-            return
-
-        # Assuming the first column in the table contains the course ID
-        course_id = self.courses_table.item(selected_items, 0).text()
-
-        # Confirm deletion
-        reply = QMessageBox.question(
-            self,
-            "Confirm Deletion",
-            "Are you sure you want to delete this course?",
-            QMessageBox.Yes | QMessageBox.No,
-            QMessageBox.No,
-        )
-        if reply == QMessageBox.Yes:
+        course_id = self.confirm_delete_selected(self.courses_table, "course")
+        if course_id is not None:
             self.course_controller.delete_course(course_id)
-            self.update_courses_table()
+            self.courses_model.remove_row(course_id)
+            if course_id == self.currently_editing_course_id:
+                self.currently_editing_course_id = None
+                self.clear_course_input_fields()
+            self.refresh_courses_dropdown()
+            self.invalidate_course_students(course_id)
+            if (
+                self._pending_course is not None
+                and self._pending_course[1] == course_id
+            ):
+                self._pending_course = None
+                self.course_students_model.set_rows([])
             QMessageBox.information(self, "Success", "Course deleted successfully.")
 
     def clear_course_input_fields(self):
@@ -1285,7 +1479,7 @@ class EduMatrixApp(QMainWindow):
         self.course_name_input.clear()
         self.course_start_date_input.clear()
         self.course_end_date_input.clear()
-        self.course_credits_input.clear()
+        self.clear_number(self.course_credits_input)
         self.course_professor_id_input.clear()
 
     def load_course_for_editing(self, index):
@@ -1297,39 +1491,110 @@ class EduMatrixApp(QMainWindow):
         index : QModelIndex
             The index of the selected item in the table.
         """
-        course_id = self.courses_table.item(
-            index.row(), 0
-        ).text()  # Assuming course ID is in the first column
-        self.currently_editing_course_id = int(course_id)
+        # The model already holds the course, so no database read is needed
+        course = self.courses_model.row_at(index.row())
+        self.currently_editing_course_id = course.course_id
 
-        course = self.course_controller.get_course(self.currently_editing_course_id)
-        if course:
-            self.course_name_input.setText(course.name)
-            self.course_start_date_input.setDate(
-                QDate.fromString(course.start_date, "yyyy-MM-dd")
-            )
-            self.course_end_date_input.setDate(
-                QDate.fromString(course.end_date, "yyyy-MM-dd")
-            )
-            self.course_credits_input.setText(str(course.credit_hours))
-            self.course_professor_id_input.setText(str(course.professor_id))
+        self.course_name_input.setText(course.name)
+        self.course_start_date_input.setDate(
+            QDate.fromString(course.start_date, Qt.ISODate)
+        )
+        self.course_end_date_input.setDate(
+            QDate.fromString(course.end_date, Qt.ISODate)
+        )
+        self.show_number(self.course_credits_input, course.credit_hours)
+        self.course_professor_id_input.setText(
+            "" if course.professor_id is None else str(course.professor_id)
+        )
 
-    def on_course_selected(self, selected):
+    def on_course_selected(self, current, previous):
         """
         Handle the event when a course is selected in the UI.
 
         Args:
-            selected: The selected item in the UI.
+            current: The index of the newly current row.
+            previous: The index of the previously current row.
 
         Returns:
             None
         """
-        if selected.indexes():
-            selected_row = selected.indexes()[0].row()
-            course_id = self.courses_table.item(
-                selected_row, 0
-            ).text()  # Assuming course ID is in the first column
-            self.populate_course_students(int(course_id))
+        if current.isValid():
+            selected_row = current.row()
+            self._pending_course = (
+                selected_row,
+                self.courses_model.row_at(selected_row).course_id,
+            )
+            # Only the last of a burst of selection changes fills the table
+            self._course_selection_timer.start()
+
+    def show_pending_course_students(self):
+        """
+        Fills the course_students_table for the last selected course.
+        """
+        if self._pending_course is None:
+            return
+        selected_row, course_id = self._pending_course
+        if course_id == self._shown_course_id:
+            return
+        if course_id in self._course_students_cache:
+            self.populate_course_students(course_id)
+        else:
+            self.prefetch_course_students(selected_row)
+
+    def prefetch_course_students(self, row: int):
+        """
+        Loads the students of the courses around a table row in one query, so
+        that moving through the table is served from memory.
+
+        The query runs on the thread pool; on_course_students_fetched fills
+        the table once it returns.
+
+        Parameters
+        ----------
+        row : int
+            The row of the courses table to load around.
+        """
+        course_ids = [
+            course_id
+            for course_id in self.record_ids_around(
+                self.courses_model, row, COURSE_STUDENTS_PREFETCH
+            )
+            if course_id not in self._course_students_cache
+        ]
+        if not course_ids:
+            return
+
+        generation = self._course_students_generation
+        worker = QueryWorker(
+            self.student_controller.get_students_for_courses, course_ids
+        )
+        worker.signals.result.connect(
+            lambda students: self.on_course_students_fetched(students, generation)
+        )
+        worker.signals.error.connect(
+            lambda message: QMessageBox.warning(self, "Database Error", message)
+        )
+        self.worker_pool.start(worker)
+
+    def on_course_students_fetched(self, students, generation: int):
+        """
+        Caches the result of a background course roster lookup and shows the
+        selected course's students if they are among them.
+
+        Parameters
+        ----------
+        students : Dict[int, list]
+            Course IDs mapped to their students.
+        generation : int
+            The cache generation the lookup was started in.
+        """
+        if generation != self._course_students_generation:
+            # Enrollments or students changed while the query ran
+            self.show_pending_course_students()
+            return
+        self._course_students_cache.update(students)
+        if self._pending_course is not None and self._pending_course[1] in students:
+            self.populate_course_students(self._pending_course[1])
 
     def populate_course_students(self, course_id):
         """
@@ -1340,21 +1605,29 @@ class EduMatrixApp(QMainWindow):
         course_id : int
             The ID of the selected course.
         """
-        students = self.student_controller.get_students_for_course(course_id)
+        students = self._course_students_cache.get(course_id)
+        if students is None:
+            students = self.student_controller.get_students_for_course(course_id)
+            self._course_students_cache[course_id] = students
+        self.course_students_model.set_rows(students)
+        self._shown_course_id = course_id
 
-        self.course_students_table.setRowCount(len(students))
+    def invalidate_course_students(self, course_id: Optional[int] = None):
+        """
+        Drops cached course rosters after enrollments or students change.
 
-        for row, student in enumerate(students):
-            # Assuming student data is a tuple like (student_id, first_name, last_name)
-            self.course_students_table.setItem(
-                row, 0, self.create_table_item(str(student[0]))
-            )  # Student ID
-            self.course_students_table.setItem(
-                row, 1, self.create_table_item(student[1])
-            )  # First Name
-            self.course_students_table.setItem(
-                row, 2, self.create_table_item(student[2])
-            )  # Last Name
+        Parameters
+        ----------
+        course_id : int, optional
+            The course whose students changed. Drops every course if omitted.
+        """
+        if course_id is None:
+            self._course_students_cache.clear()
+        else:
+            self._course_students_cache.pop(course_id, None)
+        self._course_students_generation += 1
+        # Let the next selection of the shown course reload it
+        self._shown_course_id = None
 
 
 def main():
@@ -1369,9 +1642,8 @@ def main():
 
     login_dialog = LoginDialog()
     if login_dialog.exec_() == QDialog.Accepted:
-        db_manager = DatabaseManager(
-            "/home/curranz/dev/py/git/EduMatrix/edumatrix/edumatrix.db"
-        )  # Assuming 'edumatrix.db' as the database file
+        trace = print if os.environ.get("EDUMATRIX_SQL_TRACE") else None
+        db_manager = DatabaseManager(get_db_path(), trace=trace)
         db_manager.initialize_database()
         student_controller = StudentController(db_manager)
         professor_controller = ProfessorController(db_manager)
@@ -1380,6 +1652,9 @@ def main():
         main_window = EduMatrixApp(
             student_controller, professor_controller, course_controller
         )
+        # Let running workers finish before their connections are closed
+        app.aboutToQuit.connect(main_window.worker_pool.waitForDone)
+        app.aboutToQuit.connect(db_manager.close)
         main_window.showMaximized()
         sys.exit(app.exec_())
     else:
@@ -10,6 +10,16 @@ class Student:
     Represents a student.
     """
 
+    __slots__ = (
+        "student_id",
+        "first_name",
+        "last_name",
+        "age",
+        "degree_program",
+        "completed_credits",
+        "gpa",
+    )
+
     def __init__(
         self,
         student_id: int,
@@ -54,6 +64,14 @@ class Professor:
     Represents a professor.
     """
 
+    __slots__ = (
+        "professor_id",
+        "first_name",
+        "last_name",
+        "department",
+        "academic_achievement",
+    )
+
     def __init__(
         self,
         professor_id: int,
@@ -90,6 +108,16 @@ class Course:
     Represents a course.
     """
 
+    __slots__ = (
+        "course_id",
+        "start_date",
+        "end_date",
+        "name",
+        "credit_hours",
+        "professor_id",
+        "professor_name",
+    )
+
     def __init__(
         self,
         course_id: int,
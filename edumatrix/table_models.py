@@ -0,0 +1,388 @@
+#!/usr/bin/python3
+"""
+This module contains the Qt table models backing the application's tables.
+"""
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from PyQt5.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class RecordTableModel(QAbstractTableModel):
+    """
+    Read-only table model over a list of records.
+
+    Cells are read straight from the records when the view asks for them, so
+    no per-cell item objects are created. Records are either model objects,
+    read through ATTRIBUTES, or tuple-like rows indexed by column.
+
+    When PAGE_SIZE is set, only the first page of records is exposed to the
+    view; the rest are handed over a page at a time through fetchMore as the
+    user scrolls towards them.
+
+    Records can instead be read from a page source with set_source, so that
+    only the pages the user scrolls to are ever loaded from the database.
+    """
+
+    # Column headers shown by the view.
+    HEADERS: Sequence[str] = ()
+
+    # Attribute read for each column; empty for tuple-like rows.
+    ATTRIBUTES: Sequence[str] = ()
+
+    # Number of records exposed to the view per fetch; None shows them all.
+    PAGE_SIZE: Optional[int] = None
+
+    # Attribute holding each record's ID, for the single-row updates.
+    ID_ATTRIBUTE: Optional[str] = None
+
+    def __init__(self, rows: Optional[Iterable] = None, parent=None):
+        """
+        Read-only table model over a list of records.
+
+        Parameters
+        ----------
+        rows : Iterable, optional
+            The initial records.
+        parent : QObject, optional
+            The parent Qt object.
+        """
+        super().__init__(parent)
+        self._all: List = []
+        self._rows: List = []
+        # Record ID -> position in _all, built on first use.
+        self._row_index: Optional[Dict] = None
+        # Returns the records after a given ID; None when there is no source.
+        self._fetch_page: Optional[Callable[[int, int], List]] = None
+        self._load(rows if rows is not None else [])
+
+    def _load(self, rows: Iterable):
+        """
+        Store the records, exposing the first page of them.
+        """
+        self._all = list(rows)
+        self._row_index = None
+        self._fetch_page = None
+        if self.PAGE_SIZE is None:
+            self._rows = self._all
+        else:
+            self._rows = self._all[: self.PAGE_SIZE]
+
+    def rowCount(self, parent=QModelIndex()) -> int:
+        """
+        Return the number of records; table models have no child rows.
+        """
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()) -> int:
+        """
+        Return the number of columns.
+        """
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+        """
+        Return the display text of a cell, right alignment for numeric cells,
+        or the record's ID for Qt.UserRole.
+        """
+        if not index.isValid():
+            return None
+        record = self._rows[index.row()]
+        if role == Qt.UserRole and self.ID_ATTRIBUTE:
+            return getattr(record, self.ID_ATTRIBUTE)
+        if role not in (Qt.DisplayRole, Qt.TextAlignmentRole):
+            return None
+
+        if self.ATTRIBUTES:
+            value = getattr(record, self.ATTRIBUTES[index.column()])
+        else:
+            value = record[index.column()]
+        if role == Qt.TextAlignmentRole:
+            if isinstance(value, (int, float)):
+                return int(Qt.AlignRight | Qt.AlignVCenter)
+            return None
+        if value is None:
+            return ""
+        if isinstance(value, float):
+            # Two decimals hide binary rounding artifacts such as 3.4000000001
+            return f"{value:.2f}"
+        return str(value)
+
+    def headerData(self, section: int, orientation, role: int = Qt.DisplayRole):
+        """
+        Return the column headers; rows are left unlabelled.
+        """
+        if role == Qt.DisplayRole and orientation == Qt.Horizontal:
+            return self.HEADERS[section]
+        return None
+
+    def canFetchMore(self, parent=QModelIndex()) -> bool:
+        """
+        Return whether records remain that the view has not been given yet.
+        """
+        if parent.isValid():
+            return False
+        return len(self._rows) < len(self._all) or self._fetch_page is not None
+
+    def fetchMore(self, parent=QModelIndex()):
+        """
+        Expose the next page of records to the view.
+        """
+        if not self.canFetchMore(parent):
+            return
+        if self._fetch_page is not None:
+            self._fetch_from_source()
+            return
+        start = len(self._rows)
+        end = min(start + self.PAGE_SIZE, len(self._all))
+        self.beginInsertRows(QModelIndex(), start, end - 1)
+        self._rows.extend(self._all[start:end])
+        self.endInsertRows()
+
+    def set_rows(self, rows: Iterable):
+        """
+        Replace all records shown by the model.
+
+        Parameters
+        ----------
+        rows : Iterable
+            The new records.
+        """
+        self.beginResetModel()
+        self._load(rows)
+        self.endResetModel()
+
+    def set_source(self, fetch_page: Callable[[int, int], List]):
+        """
+        Replace all records with ones read a page at a time from a source.
+
+        Records must come back in ID order, so a record added later is
+        reached by the last page rather than missed.
+
+        Parameters
+        ----------
+        fetch_page : Callable[[int, int], List]
+            Called with the ID of the last record loaded (0 for the first
+            page) and PAGE_SIZE; returns the records that follow it.
+        """
+        self.beginResetModel()
+        self._load([])
+        self._fetch_page = fetch_page
+        self.endResetModel()
+
+    def _fetch_from_source(self):
+        """
+        Load the next page of records from the page source.
+        """
+        last_id = getattr(self._all[-1], self.ID_ATTRIBUTE) if self._all else 0
+        page = self._fetch_page(last_id, self.PAGE_SIZE)
+        if len(page) < self.PAGE_SIZE:
+            self._fetch_page = None
+        if not page:
+            return
+        start = len(self._all)
+        self.beginInsertRows(QModelIndex(), start, start + len(page) - 1)
+        self._all.extend(page)
+        if self._rows is not self._all:
+            self._rows.extend(page)
+        self.endInsertRows()
+        if self._row_index is not None:
+            for position, record in enumerate(page, start):
+                self._row_index[getattr(record, self.ID_ATTRIBUTE)] = position
+
+    def _position_of(self, record_id) -> Optional[int]:
+        """
+        Return the position of the record with the given ID, if present.
+        """
+        if self._row_index is None:
+            self._row_index = {
+                getattr(record, self.ID_ATTRIBUTE): position
+                for position, record in enumerate(self._all)
+            }
+        return self._row_index.get(record_id)
+
+    def append_row(self, record):
+        """
+        Add one record to the end of the model.
+
+        Parameters
+        ----------
+        record : object
+            The new record.
+        """
+        if self._fetch_page is not None:
+            # The source has not been read to the end; its last page will
+            # include the new record.
+            return
+        position = len(self._all)
+        if len(self._rows) < position:
+            # Still paging in; fetchMore will reach the new record.
+            self._all.append(record)
+        else:
+            self.beginInsertRows(QModelIndex(), position, position)
+            self._all.append(record)
+            if self._rows is not self._all:
+                self._rows.append(record)
+            self.endInsertRows()
+        if self._row_index is not None:
+            self._row_index[getattr(record, self.ID_ATTRIBUTE)] = position
+
+    def update_row(self, record):
+        """
+        Replace the record that has the same ID as the given one.
+
+        Parameters
+        ----------
+        record : object
+            The updated record.
+        """
+        position = self._position_of(getattr(record, self.ID_ATTRIBUTE))
+        if position is None:
+            return
+        self._all[position] = record
+        if position < len(self._rows):
+            self._rows[position] = record
+            self.dataChanged.emit(
+                self.index(position, 0),
+                self.index(position, self.columnCount() - 1),
+            )
+
+    def remove_row(self, record_id):
+        """
+        Remove the record with the given ID.
+
+        Parameters
+        ----------
+        record_id : object
+            The ID of the record to remove.
+        """
+        position = self._position_of(record_id)
+        if position is None:
+            return
+        if position < len(self._rows):
+            self.beginRemoveRows(QModelIndex(), position, position)
+            del self._all[position]
+            if self._rows is not self._all:
+                del self._rows[position]
+            self.endRemoveRows()
+        else:
+            del self._all[position]
+        # Every later record has moved up one position.
+        self._row_index = None
+
+    def row_at(self, row: int):
+        """
+        Return the record shown in a given row.
+
+        Parameters
+        ----------
+        row : int
+
+        Returns
+        -------
+        object
+            The record at that row.
+        """
+        return self._rows[row]
+
+
+class StudentTableModel(RecordTableModel):
+    """
+    Table model for Student objects.
+    """
+
+    PAGE_SIZE = 100
+
+    HEADERS = ("ID", "First Name", "Last Name", "Age", "Degree", "Credits", "GPA")
+    ID_ATTRIBUTE = "student_id"
+    ATTRIBUTES = (
+        "student_id",
+        "first_name",
+        "last_name",
+        "age",
+        "degree_program",
+        "completed_credits",
+        "gpa",
+    )
+
+
+class ProfessorTableModel(RecordTableModel):
+    """
+    Table model for Professor objects.
+    """
+
+    PAGE_SIZE = 100
+
+    HEADERS = ("ID", "First Name", "Last Name", "Department", "Achievement")
+    ID_ATTRIBUTE = "professor_id"
+    ATTRIBUTES = (
+        "professor_id",
+        "first_name",
+        "last_name",
+        "department",
+        "academic_achievement",
+    )
+
+
+class CourseTableModel(RecordTableModel):
+    """
+    Table model for Course objects.
+    """
+
+    PAGE_SIZE = 100
+
+    HEADERS = (
+        "ID",
+        "Name",
+        "Start Date",
+        "End Date",
+        "Credits",
+        "Professor ID",
+        "Professor Name",
+    )
+    ATTRIBUTES = (
+        "course_id",
+        "name",
+        "start_date",
+        "end_date",
+        "credit_hours",
+        "professor_id",
+        "professor_name",
+    )
+    ID_ATTRIBUTE = "course_id"
+
+
+class StudentCoursesModel(RecordTableModel):
+    """
+    Table model for the rows returned by get_courses_for_student.
+    """
+
+    PAGE_SIZE = 50
+
+    HEADERS = (
+        "Course ID",
+        "Course Name",
+        "Start Date",
+        "End Date",
+        "Credit Hours",
+        "Professor",
+    )
+
+
+class ProfessorCoursesModel(RecordTableModel):
+    """
+    Table model for the rows returned by get_courses_for_professor.
+    """
+
+    PAGE_SIZE = 50
+
+    HEADERS = ("Course Name", "Start Date", "End Date", "Credit Hours")
+
+
+class CourseStudentsModel(RecordTableModel):
+    """
+    Table model for the rows returned by get_students_for_course.
+    """
+
+    PAGE_SIZE = 50
+
+    HEADERS = ("Student ID", "First Name", "Last Name")
@@ -0,0 +1,117 @@
+#!/usr/bin/python3
+"""
+This module contains the background workers used by the application.
+"""
+import csv
+from itertools import islice
+from typing import Callable, Iterable, Sequence, Tuple
+
+from PyQt5.QtCore import QObject, QRunnable, pyqtSignal
+
+# Write buffer for CSV exports, so rows reach the OS in large chunks.
+CSV_BUFFER_SIZE = 1024 * 1024
+
+# Number of rows written between progress updates during a CSV export.
+EXPORT_PROGRESS_INTERVAL = 1000
+
+
+class WorkerSignals(QObject):
+    """
+    Signals emitted by a worker, delivered on the thread that connected them.
+    """
+
+    # Number of items processed so far
+    progress = pyqtSignal(int)
+    # Description of the finished result
+    finished = pyqtSignal(str)
+    # Error message if the work failed
+    error = pyqtSignal(str)
+    # Value returned by the work
+    result = pyqtSignal(object)
+
+
+class QueryWorker(QRunnable):
+    """
+    Runs a database query on a QThreadPool thread and emits its result.
+    """
+
+    def __init__(self, query: Callable, *args):
+        """
+        Runs a database query on a QThreadPool thread and emits its result.
+
+        Parameters
+        ----------
+        query : Callable
+            The controller method to call. DatabaseManager gives the pool
+            thread its own connection.
+        *args
+            Arguments passed to query.
+        """
+        super().__init__()
+        self.query = query
+        self.args = args
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """
+        Call the query, emitting result with its return value or error.
+        """
+        try:
+            result = self.query(*self.args)
+        except Exception as exc:
+            self.signals.error.emit(str(exc))
+        else:
+            self.signals.result.emit(result)
+
+
+class CsvExportWorker(QRunnable):
+    """
+    Writes rows to a CSV file on a QThreadPool thread.
+    """
+
+    def __init__(self, filename: str, header: Sequence[str], rows: Iterable[Tuple]):
+        """
+        Writes rows to a CSV file on a QThreadPool thread.
+
+        Parameters
+        ----------
+        filename : str
+            Path of the CSV file to write.
+        header : Sequence[str]
+            The header row.
+        rows : Iterable[Tuple]
+            The data rows. They are consumed on the worker thread.
+        """
+        super().__init__()
+        self.filename = filename
+        self.header = header
+        self.rows = rows
+        self.signals = WorkerSignals()
+
+    def run(self):
+        """
+        Write the file, emitting progress every EXPORT_PROGRESS_INTERVAL rows.
+        """
+        try:
+            with open(
+                self.filename,
+                "w",
+                newline="",
+                encoding="utf-8",
+                buffering=CSV_BUFFER_SIZE,
+            ) as csvfile:
+                writer = csv.writer(csvfile)
+                writer.writerow(self.header)
+
+                rows = iter(self.rows)
+                written = 0
+                batch = list(islice(rows, EXPORT_PROGRESS_INTERVAL))
+                while batch:
+                    writer.writerows(batch)
+                    written += len(batch)
+                    self.signals.progress.emit(written)
+                    batch = list(islice(rows, EXPORT_PROGRESS_INTERVAL))
+        except Exception as exc:
+            self.signals.error.emit(str(exc))
+        else:
+            self.signals.finished.emit(self.filename)
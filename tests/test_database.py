@@ -0,0 +1,112 @@
+"""
+Tests for the schema upgrade in DatabaseManager.initialize_database.
+"""
+import os
+import sqlite3
+import tempfile
+import unittest
+
+from edumatrix.database import DatabaseManager
+
+# The schema created by the original version of the application, before
+# PRAGMA user_version was used.
+BASELINE_SCHEMA = """
+    CREATE TABLE Students (
+        StudentID INTEGER PRIMARY KEY AUTOINCREMENT,
+        FirstName TEXT NOT NULL,
+        LastName TEXT NOT NULL,
+        Age INTEGER,
+        DegreeProgram TEXT,
+        CompletedCredits INTEGER,
+        GPA REAL
+    );
+    CREATE TABLE Professors (
+        ProfessorID INTEGER PRIMARY KEY AUTOINCREMENT,
+        FirstName TEXT NOT NULL,
+        LastName TEXT NOT NULL,
+        Department TEXT,
+        AcademicAchievement TEXT
+    );
+    CREATE TABLE Courses (
+        CourseID INTEGER PRIMARY KEY AUTOINCREMENT,
+        StartDate TEXT,
+        EndDate TEXT,
+        Name TEXT NOT NULL,
+        CreditHours INTEGER,
+        ProfessorID INTEGER,
+        FOREIGN KEY (ProfessorID) REFERENCES Professors(ProfessorID)
+    );
+    CREATE TABLE Enrollments (
+        StudentID INTEGER,
+        CourseID INTEGER,
+        Grade TEXT,
+        PRIMARY KEY (StudentID, CourseID),
+        FOREIGN KEY (StudentID) REFERENCES Students(StudentID),
+        FOREIGN KEY (CourseID) REFERENCES Courses(CourseID)
+    );
+"""
+
+
+class SchemaUpgradeTest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.db_path = os.path.join(self.tmpdir.name, "baseline.db")
+        conn = sqlite3.connect(self.db_path)
+        conn.executescript(BASELINE_SCHEMA)
+        conn.executescript(
+            """
+            INSERT INTO Professors VALUES (1, 'Ada', 'Byron', 'Maths', 'PhD');
+            INSERT INTO Students VALUES (1, 'Alan', 'Turing', 20, 'CS', 30, 3.5);
+            INSERT INTO Students VALUES (2, 'Grace', 'Hopper', '', 'CS', '', 3.9);
+            INSERT INTO Courses VALUES (1, '2023-01-01', '2023-06-01', 'Logic', 3, 1);
+            INSERT INTO Enrollments VALUES (1, 1, NULL);
+            INSERT INTO Enrollments VALUES (2, 1, NULL);
+            INSERT INTO Enrollments VALUES (3, 1, NULL);
+            """
+        )
+        conn.close()
+        self.db = DatabaseManager(self.db_path)
+
+    def tearDown(self):
+        self.db.close()
+        self.tmpdir.cleanup()
+
+    def test_upgrade_keeps_rows(self):
+        self.db.initialize_database()
+
+        self.assertEqual(self.db.get_schema_version(), DatabaseManager.SCHEMA_VERSION)
+        students = [tuple(row) for row in self.db.list_all_students()]
+        self.assertEqual(
+            students,
+            [
+                (1, "Alan", "Turing", 20, "CS", 30, 3.5),
+                (2, "Grace", "Hopper", None, "CS", None, 3.9),
+            ],
+        )
+        self.assertEqual(
+            [tuple(row)[:2] for row in self.db.get_students_for_course(1)],
+            [(1, "Alan"), (2, "Grace")],
+        )
+
+    def test_upgrade_removes_autoincrement(self):
+        self.db.initialize_database()
+
+        conn = self.db.get_connection()
+        for table in DatabaseManager.TABLE_DEFINITIONS:
+            sql = conn.execute(
+                "SELECT sql FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (table,),
+            ).fetchone()[0]
+            self.assertNotIn("AUTOINCREMENT", sql)
+
+    def test_upgraded_database_is_reopened_unchanged(self):
+        self.db.initialize_database()
+        self.db.close()
+
+        self.db = DatabaseManager(self.db_path)
+        self.db.initialize_database()
+        self.assertEqual(len(self.db.list_all_students()), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()